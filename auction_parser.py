@@ -0,0 +1,421 @@
+"""
+Browser-free parsing of realforeclose pages: detail page HTML -> extracted
+auction dict, extracted auction -> auctions row, and the per grid row
+decisions of incremental and summary runs.
+
+Kept apart from index.py, which imports the whole Selenium stack, so the
+parsers can be used (and tested) without a browser installed.
+"""
+import hashlib
+import os
+import re
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from html.parser import HTMLParser
+from urllib.parse import urlparse, parse_qs
+
+
+def is_date(string, date_format="%m/%d/%Y %I:%M %p"):
+    # Remove timezone abbreviation (e.g., ' ET') if present
+    string = string.rsplit(' ', 1)[0] if string.endswith(" ET") else string
+    try:
+        datetime.strptime(string, date_format)
+        return True
+    except ValueError:
+        return False
+
+def get_aid_from_url(url):
+    try:
+        query_params = parse_qs(urlparse(url).query)
+        return query_params.get("AID", [None])[0]
+    except Exception as e:
+        print("Error occured in getting AID from url ", e)
+
+def parse_amount(value):
+    """'$298,324.30' -> Decimal('298324.30'), None for blanks or anything non-numeric."""
+    cleaned = (value or "").replace("$", "").replace(",", "").strip()
+    try:
+        return Decimal(cleaned) if cleaned else None
+    except InvalidOperation:
+        return None
+
+def parse_auction_datetime(value):
+    """'10/01/2025 10:00 AM ET' -> datetime, None if it isn't an auction date."""
+    if not value or not is_date(value):
+        return None
+    value = value.rsplit(" ", 1)[0] if value.endswith(" ET") else value
+    return datetime.strptime(value, "%m/%d/%Y %I:%M %p")
+
+def search_key(value):
+    """Same normalization as dbhandler.search_key: '06-2023-CA-001234' -> '062023CA001234'."""
+    return re.sub(r"[^0-9A-Z]", "", (value or "").upper())[:64]
+
+def auction_to_row(data):
+    """Map one extracted auction ({"auction_status": ..., "details": ...}) to an auctions row dict."""
+    auction_status_info = data.get("auction_status", {})
+    details = data.get("details", {})
+
+    def get_detail(key):
+        return details.get(key, "") or ""
+
+    # Auction status & date logic
+    status = auction_status_info.get("status") or auction_status_info.get("Auction Starts") or ""
+    date = auction_status_info.get("date") or auction_status_info.get("Auction Starts") or ""
+
+    if not is_date(date):
+        date = ""
+    if status.lower() == "auction starts":
+        auction_date = date
+        auction_status = "Auction Starts"
+    else:
+        auction_date = date or ""
+        auction_status = status or ""
+
+    amount = auction_status_info.get("amount", "")
+    if auction_status.lower() != "auction sold":
+        amount = ""
+
+    link = auction_status_info.get("link")
+    aid = get_aid_from_url(link) if link else None
+
+    return {
+        "PropertyAddress": get_detail("Property Address"),
+        "AuctionType": get_detail("Case Type"),
+        "CaseNo": get_detail("Case Number"),
+        "FinalJudgementAmount": parse_amount(get_detail("Final Judgment Amount")),
+        "ParcelID": get_detail("Parcel ID"),
+        "AuctionDate": auction_date,
+        "AuctionDateTime": parse_auction_datetime(auction_date),
+        "AuctionSoldAmount": parse_amount(amount),
+        "SoldTo": "",
+        "PlaintiffMaxBid": "",
+        "AuctionStatus": auction_status,
+        "Link": link,
+        "AID": int(aid) if aid and str(aid).isdigit() else None,
+        "CaseNoKey": search_key(get_detail("Case Number")),
+        "ParcelKey": search_key(get_detail("Parcel ID")),
+        "GridHash": data.get("grid_hash", ""),
+        "County": data.get("county", ""),
+    }
+
+
+def parse_auction_stats(stats_texts, url):
+    """
+    Turn the texts of the `.AUCTION_STATS > div` cells (label, value, label, value...)
+    into the auction status dict.
+    """
+    auction_status = ""
+    date = ""
+    amount = ""
+
+    i = 0
+    while i < len(stats_texts):
+        label = stats_texts[i].strip()
+        value = stats_texts[i + 1].strip() if i + 1 < len(stats_texts) else ""
+
+        # First label will be status
+        if not auction_status and label:
+            auction_status = label
+            date = value  # may be empty for postponed/canceled
+            if not is_date(date):
+                auction_status = date
+                date = ""
+        elif label.lower() == "amount":
+            amount = value
+
+        i += 2
+
+    return {
+        "status": auction_status,
+        "date": date,
+        "amount": amount,
+        "link":url
+    }
+
+def merge_detail_rows(rows):
+    """
+    Build the case details dict from (th text, td text) pairs of the bdTab table.
+    Rows with a blank label continue the value of the previous label
+    (e.g. the second line of the property address).
+    """
+    details = {}
+    last_label = None
+    for th_text, td_text in rows:
+        label_raw = th_text.strip().replace(":", "")
+        if label_raw in ("", "\xa0"):
+            if last_label:
+                continuation = td_text.strip()
+                if continuation:
+                    prev = details.get(last_label, "")
+                    details[last_label] = (prev + " " + continuation).strip()
+            continue
+
+        details[label_raw] = td_text.strip()
+        last_label = label_raw
+    return details
+
+
+# ============================================================
+# Raw HTML parsing (no WebDriver round-trips)
+# ============================================================
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+BLOCK_TAGS = {"div", "p", "tr", "table", "li", "ul", "ol", "h1", "h2", "h3", "h4", "h5", "h6", "form", "section"}
+# Opening one of these closes an unclosed sibling of the listed tags
+IMPLIED_END_TAGS = {
+    "td": ("td", "th"),
+    "th": ("td", "th"),
+    "tr": ("tr", "td", "th"),
+    "li": ("li",),
+    "p": ("p",),
+}
+
+class HtmlNode:
+    def __init__(self, tag, attrs=None, parent=None):
+        self.tag = tag
+        self.attrs = dict(attrs or {})
+        self.parent = parent
+        self.children = []  # HtmlNode or str
+
+    @property
+    def classes(self):
+        return (self.attrs.get("class") or "").split()
+
+    def iter(self):
+        for child in self.children:
+            if isinstance(child, HtmlNode):
+                yield child
+                yield from child.iter()
+
+    def find_all(self, tag=None, class_name=None):
+        return [
+            node for node in self.iter()
+            if (tag is None or node.tag == tag) and (class_name is None or class_name in node.classes)
+        ]
+
+    def find_by_id(self, element_id):
+        for node in self.iter():
+            if node.attrs.get("id") == element_id:
+                return node
+        return None
+
+    def child_elements(self, tag=None):
+        return [c for c in self.children if isinstance(c, HtmlNode) and (tag is None or c.tag == tag)]
+
+    def text(self):
+        """Visible text, roughly the way WebElement.text renders it."""
+        parts = []
+        self._collect_text(parts)
+        lines = [" ".join(line.split()) for line in "".join(parts).split("\n")]
+        return "\n".join(line for line in lines if line)
+
+    def _collect_text(self, parts):
+        for child in self.children:
+            if isinstance(child, str):
+                parts.append(child)
+            elif child.tag in ("script", "style"):
+                continue
+            elif child.tag == "br":
+                parts.append("\n")
+            else:
+                if child.tag in BLOCK_TAGS:
+                    parts.append("\n")
+                elif child.tag in ("td", "th"):
+                    parts.append(" ")
+                child._collect_text(parts)
+                if child.tag in BLOCK_TAGS:
+                    parts.append("\n")
+
+class HtmlTreeBuilder(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = HtmlNode("#document")
+        self.current = self.root
+
+    def handle_starttag(self, tag, attrs):
+        for closes in IMPLIED_END_TAGS.get(tag, ()):
+            if self.current.tag == closes:
+                self.current = self.current.parent
+                break
+        node = HtmlNode(tag, attrs, self.current)
+        self.current.children.append(node)
+        if tag not in VOID_TAGS:
+            self.current = node
+
+    def handle_startendtag(self, tag, attrs):
+        self.current.children.append(HtmlNode(tag, attrs, self.current))
+
+    def handle_endtag(self, tag):
+        # Pop back to the matching open tag, ignore stray end tags
+        node = self.current
+        while node is not None and node.tag != tag:
+            node = node.parent
+        if node is not None and node.parent is not None:
+            self.current = node.parent
+
+    def handle_data(self, data):
+        self.current.children.append(data)
+
+def parse_html(html):
+    builder = HtmlTreeBuilder()
+    builder.feed(html or "")
+    builder.close()
+    return builder.root
+
+def parse_auction_detail_html(html, url):
+    """
+    Parse an auction detail page from raw HTML into the same dict
+    extract_auction_and_case() returns.
+
+    Returns None when the page doesn't contain the auction container
+    (blocked, logged out or unknown markup), so callers can fall back to the driver.
+    """
+    aid = get_aid_from_url(url)
+    if not aid:
+        return None
+    aid_str = str(aid)
+
+    root = parse_html(html)
+    container = root.find_by_id(f"AIC_MAIN_{aid_str}")
+    if container is None:
+        return None
+
+    result = {"auction_status": {}, "details": {}}
+
+    auction_item = container.find_by_id(f"AITEM_{aid_str}")
+    if auction_item is not None:
+        stats_divs = [
+            div
+            for stats in auction_item.find_all(class_name="AUCTION_STATS")
+            for div in stats.child_elements("div")
+        ]
+        result["auction_status"] = parse_auction_stats([div.text() for div in stats_divs], url)
+    else:
+        result["auction_status"] = {"status": "", "date": "", "amount": ""}
+
+    tables = container.find_all("table", "bdTab")
+    if not tables:
+        tables = [
+            table
+            for bdetails in root.find_all("div", "bdetails")
+            for table in bdetails.find_all("table", "bdTab")
+        ]
+
+    if tables:
+        detail_rows = []
+        for row in tables[0].find_all("tr"):
+            ths = row.find_all("th")
+            tds = row.find_all("td")
+            if not ths or not tds:
+                continue
+            detail_rows.append((ths[0].text(), tds[0].text()))
+        result["details"] = merge_detail_rows(detail_rows)
+
+    return result
+
+def has_auction_data(result):
+    """
+    True when a parsed page actually carries the auction: a skeleton page that
+    fills in through JS still has the AIC_MAIN container but no status or details.
+    """
+    return bool(result and (result["details"] or result["auction_status"].get("status")))
+
+def auction_fragments_html(strings, aid):
+    """
+    Join the HTML fragments of one auction found in AJAX payload strings into a
+    page the detail parser accepts. Only fragments naming this item (AITEM_<aid>
+    or AIC_MAIN_<aid>) are kept, a payload can carry other auctions' tables too.
+    Returns None when there are none.
+    """
+    own_item = re.compile(rf"\b(?:AITEM|AIC_MAIN)_{re.escape(str(aid))}(?!\d)")
+    fragments = [value for value in strings if "<" in value and own_item.search(value)]
+    if not fragments:
+        return None
+    # AJAX fragments come without the page container, wrap them so the page parser applies
+    return f'<div id="AIC_MAIN_{aid}">{"".join(fragments)}</div>'
+
+
+# ============================================================
+# Incremental runs
+# ============================================================
+def grid_summary_hash(summary):
+    return hashlib.sha1(" ".join((summary or "").split()).encode("utf-8")).hexdigest()
+
+def is_final_status(status):
+    """Auctions in a terminal state (sold, canceled) don't change anymore."""
+    final_statuses = os.getenv("SCRAPER_FINAL_STATUSES") or "auction sold,canceled,cancelled"
+    status = (status or "").lower()
+    return any(final in status for final in final_statuses.lower().split(",") if final)
+
+def select_rows_to_fetch(grid_rows, known):
+    """
+    Split grid rows into the ones that need a detail fetch and the ones that can be skipped:
+    finalized auctions whose grid row is unchanged since they were stored.
+    """
+    to_fetch = []
+    skipped = 0
+    for row in grid_rows:
+        stored = known.get(row["link"])
+        if (
+            stored
+            and is_final_status(stored["status"])
+            and stored["grid_hash"] == grid_summary_hash(row["summary"])
+        ):
+            skipped += 1
+            continue
+        to_fetch.append(row)
+    print(f"[Incremental] {len(to_fetch)} auctions to fetch, {skipped} finalized and unchanged skipped")
+    return to_fetch, skipped
+
+
+# ============================================================
+# Summary mode (grid rows only)
+# ============================================================
+# Grid column name (lowercased, letters only) -> (section, key) in the extracted record shape.
+# Exact names only: anything else (Sold To, Status, Max Bid...) stays unmapped, the
+# auction status in particular comes from the detail page and must not be overwritten.
+GRID_COLUMN_MAP = {
+    "auctiondate": ("auction_status", "date"),
+    "casenumber": ("details", "Case Number"),
+    "caseno": ("details", "Case Number"),
+    "parcelid": ("details", "Parcel ID"),
+    "propertyaddress": ("details", "Property Address"),
+    "address": ("details", "Property Address"),
+    "finaljudgmentamount": ("details", "Final Judgment Amount"),
+    "finaljudgment": ("details", "Final Judgment Amount"),
+    "casetype": ("details", "Case Type"),
+    "auctiontype": ("details", "Case Type"),
+}
+
+def grid_row_to_record(row):
+    """
+    Build a record in the extract_auction_and_case() shape from a grid row's cells.
+    Only columns listed in GRID_COLUMN_MAP are filled, the rest stay blank so the
+    upsert keeps the stored values.
+    """
+    record = {"auction_status": {"status": "", "date": "", "amount": "", "link": row["link"]}, "details": {}}
+    for column, value in (row.get("cells") or {}).items():
+        target = GRID_COLUMN_MAP.get(re.sub(r"[^a-z]", "", column.lower()))
+        if target is None:
+            continue
+        section, key = target
+        if value and not record[section].get(key):
+            record[section][key] = value
+    return record
+
+def split_summary_rows(grid_rows, known):
+    """
+    Return (rows that need a detail page, summary records built from the grid).
+    The grid carries no reliable status, so only finalized known auctions are
+    refreshed from their grid row. New auctions, and known ones whose status can
+    still change ("Auction Starts" -> "Auction Sold"), get a detail page.
+    """
+    detail_rows = []
+    summaries = []
+    for row in grid_rows:
+        stored = known.get(row["link"])
+        if stored and is_final_status(stored["status"]):
+            summaries.append(grid_row_to_record(row))
+        else:
+            detail_rows.append(row)
+    print(f"[Summary] {len(summaries)} finalized auctions from grid, {len(detail_rows)} new or pending need detail pages")
+    return detail_rows, summaries
@@ -1,7 +1,10 @@
-from flask import Flask, request, jsonify, make_response, send_file
+from flask import Flask, request, jsonify, make_response, send_file, Response, stream_with_context
 from flask_cors import CORS
-from dbhandler import create_database_and_table, verify_login, create_user, get_all_users, delete_user, update_user, get_user_by_id, get_total_users, get_total_auctions, get_auctions,get_filtered_auctions, get_all_auction_status, update_scraper_log, get_scraper_schedule,update_scraper_schedule, get_scraper_details
+from flask_socketio import SocketIO
+from dbhandler import create_database_and_table, verify_login, create_user, get_all_users, delete_user, update_user, get_user_by_id, get_total_users, get_total_auctions, get_auctions,get_filtered_auctions, get_auctions_page, get_auction_counts, get_auctions_by_date, iter_filtered_auctions, EXPORT_COLUMNS, auction_count_cache, get_all_auction_status, update_scraper_log, acquire_scraper_lock, release_scraper_lock, get_scraper_schedule,update_scraper_schedule, get_scraper_details, get_scraper_progress, revoke_token, get_revoked_tokens
 from werkzeug.middleware.proxy_fix import ProxyFix
+from cache import ResponseCache
+from auth import TokenVerifier, LoginRateLimiter
 import html
 from datetime import datetime, timedelta
 import jwt
@@ -16,23 +19,68 @@ from apscheduler.triggers.cron import CronTrigger
 import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from index import run_scraper as run_external_scraper
+from index import run_all_counties, get_browser_service, get_counties, add_progress_listener
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 import csv
 import io  
+import itertools
+import tempfile
+import zlib
+from openpyxl import Workbook
 
 app = Flask(__name__)
 SECRET_KEY = os.getenv('SECRET_KEY')
 app.secret_key = SECRET_KEY  # Change in production
-app.wsgi_app = ProxyFix(app.wsgi_app)
+# Reverse proxies (nginx...) in front of the app. X-Forwarded-For/-Proto are only trusted
+# for that many hops; with none configured they're ignored, since any client can send them
+# and request.remote_addr keys the per-IP login limiter.
+TRUSTED_PROXIES = int(os.getenv("TRUSTED_PROXIES", "0"))
+if TRUSTED_PROXIES:
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=TRUSTED_PROXIES, x_proto=TRUSTED_PROXIES)
 
 # Allow cookies from React frontend
 CORS(app, supports_credentials=True, origins=["http://localhost:5173"])  # Change for production
 
+# Read endpoints are cached until the data changes (see invalidate_auction_caches).
+# Without RESPONSE_CACHE_DIR each process keeps its own in-memory cache, and only the
+# process that runs the scraper gets bumped: other gunicorn workers would serve
+# pre-scrape data for up to RESPONSE_CACHE_TTL. So with several workers
+# (WEB_CONCURRENCY > 1) the on-disk cache, shared by every worker, is the default.
+RESPONSE_CACHE_DIR = os.getenv("RESPONSE_CACHE_DIR") or None
+if RESPONSE_CACHE_DIR is None and int(os.getenv("WEB_CONCURRENCY", "1")) > 1:
+    RESPONSE_CACHE_DIR = os.path.join(tempfile.gettempdir(), "excess-hunters-response-cache")
+response_cache = ResponseCache(
+    ttl=int(os.getenv("RESPONSE_CACHE_TTL", "300")),
+    max_entries=int(os.getenv("RESPONSE_CACHE_SIZE", "512")),
+    directory=RESPONSE_CACHE_DIR
+)
+
+def invalidate_auction_caches():
+    response_cache.bump()
+    auction_count_cache.clear()
+
+# Live scraper progress for the dashboard (namespace /scraper)
+socketio = SocketIO(app, cors_allowed_origins=["http://localhost:5173"], async_mode="threading")
+
 JWT_SECRET = SECRET_KEY  # Use env var in production
 JWT_EXPIRATION_DAYS = 1
 
 create_database_and_table()
 
+# Verified tokens are cached until their exp; logout revokes them (persisted so every worker sees it)
+token_verifier = TokenVerifier(
+    JWT_SECRET,
+    algorithms=["HS256"],
+    load_revoked=get_revoked_tokens,
+    save_revoked=revoke_token,
+    refresh=int(os.getenv("AUTH_REVOCATION_REFRESH", "30"))
+)
+# Failed logins per email and per client IP, checked before the password hash is computed
+login_limiter_email = LoginRateLimiter(max_failures=int(os.getenv("LOGIN_MAX_FAILURES", "5")), window=900)
+login_limiter_ip = LoginRateLimiter(max_failures=int(os.getenv("LOGIN_MAX_FAILURES_IP", "20")), window=900)
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -56,15 +104,30 @@ def login():
     if email == "" or password == "":
         return jsonify({"success": False, "message": "Email and password cannot be empty"}), 400
 
+    email_key = email.lower()
+    client_ip = request.remote_addr or "unknown"
+    retry_after = max(login_limiter_email.retry_after(email_key), login_limiter_ip.retry_after(client_ip))
+    if retry_after:
+        resp = make_response(jsonify({"success": False, "message": "Too many login attempts, try again later"}), 429)
+        resp.headers["Retry-After"] = str(retry_after)
+        return resp
+
     success, error_msg, user_data = verify_login(email, password)
 
-    if success:
+    if not success:
+        login_limiter_email.failure(email_key)
+        login_limiter_ip.failure(client_ip)
+    else:
+        login_limiter_email.reset(email_key)
+
         # Create JWT payload
         payload = {
             "email": user_data["email"],
             "name": user_data["name"],
             "role": user_data["role"],
-            "exp": datetime.utcnow() + timedelta(days=JWT_EXPIRATION_DAYS)
+            "exp": datetime.utcnow() + timedelta(days=JWT_EXPIRATION_DAYS),
+            # Unique per login, so revoking one session's token never matches another's
+            "jti": uuid.uuid4().hex
         }
         token = jwt.encode(payload, JWT_SECRET, algorithm="HS256")
 
@@ -89,28 +152,22 @@ def login():
     return jsonify({"success": False, "message": error_msg}), 401
 
 
-@app.route('/check-login', methods=['GET'])
 def check_login():
+    """(is_login, is_admin) for the access_token cookie; expired, forged or revoked tokens aren't logged in."""
     token = request.cookies.get("access_token")
     if not token:
-        return jsonify({"logged_in": False}), 200
-
-    try:
-        decoded = jwt.decode(token, JWT_SECRET, algorithms=["HS256"])
-        is_admin = False 
-        if(decoded["role"]=="admin"):
-            is_admin = True
-        else:
-            is_admin = False
-            
-        return True, is_admin
-        
-    except jwt.ExpiredSignatureError:
         return False, False
-        # return jsonify({"logged_in": False, "message": "Token expired"}), 401
-    except jwt.InvalidTokenError:
+
+    decoded = token_verifier.verify(token)
+    if not decoded:
         return False, False
-        # return jsonify({"logged_in": False, "message": "Invalid token"}), 401
+    return True, decoded.get("role") == "admin"
+
+
+@app.route('/check-login', methods=['GET'])
+def check_login_status():
+    is_login, is_admin = check_login()
+    return jsonify({"logged_in": is_login, "is_admin": is_admin}), 200
 
 
 @app.route('/api/register', methods=['POST'])
@@ -129,6 +186,7 @@ def create_user_page():
 
         success, error_msg = create_user(username, email, dob, password, role)
         if success:
+            invalidate_auction_caches()
             return jsonify({"success": True, "message": "User created successfully!"}), 201
         else:
             return jsonify({"success": False, "message": error_msg}), 400
@@ -138,6 +196,9 @@ def create_user_page():
 
 @app.route('/api/logout', methods=['POST'])
 def logout():
+    token = request.cookies.get("access_token")
+    if token:
+        token_verifier.revoke(token)
     resp = make_response(jsonify({"success": True, "message": "Logged out successfully"}))
     resp.set_cookie("access_token", "", expires=0, httponly=True)
     return resp
@@ -171,6 +232,7 @@ def edit_user(user_id):
 
     success, error = update_user(user_id, name, email, dob, role)
     if success:
+        invalidate_auction_caches()
         return jsonify({"success": True, "message": "User updated successfully"}), 200
     else:
         return jsonify({"success": False, "message": error}), 500
@@ -184,6 +246,7 @@ def remove_user(user_id):
 
     success, error = delete_user(user_id)
     if success:
+        invalidate_auction_caches()
         return jsonify({"success": True, "message": "User deleted successfully"}), 200
     else:
         return jsonify({"success": False, "message": error}), 500
@@ -208,33 +271,83 @@ def analysis():
     if not (is_login and is_admin):
         return jsonify({"success": False, "message": "Not authorized"}), 401
 
-    success_users, total_users = get_total_users()
-    success_auctions, total_auctions = get_total_auctions()
+    def compute():
+        success_users, total_users = get_total_users()
+        if not success_users:
+            return False, total_users
+        success_auctions, total_auctions = get_total_auctions()
+        if not success_auctions:
+            return False, total_auctions
+        return True, {"total_users": total_users, "total_auctions": total_auctions}
 
-    if not success_users:
-        return jsonify({"success": False, "message": total_users}), 500
-    if not success_auctions:
-        return jsonify({"success": False, "message": total_auctions}), 500
+    success, data = response_cache.get_or_compute("analysis", {}, compute)
+    if not success:
+        return jsonify({"success": False, "message": data}), 500
 
     return jsonify({
         "success": True,
-        "total_users": total_users,
-        "total_auctions": total_auctions
+        **data
     }), 200
     
 
+@app.route('/api/cache-stats', methods=['GET'])
+def cache_stats():
+    is_login, is_admin = check_login()
+    if not (is_login and is_admin):
+        return jsonify({"success": False, "message": "Not authorized"}), 401
+    return jsonify({"success": True, "cache": response_cache.stats()}), 200
+
+
 @app.route('/api/auctions-status', methods=['GET'])
 def auction_status():
     try:
         is_login, _ = check_login()
         if not is_login:
             return jsonify({"success": False, "message": "Not authorized"}), 401
-        statuses = get_all_auction_status()
+        statuses = response_cache.get_or_compute("auctions-status", {}, get_all_auction_status)
         return jsonify({"auction_status": statuses}), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
+@app.route('/api/auction_counts', methods=['GET'])
+def auction_counts():
+    # Calendar: {"MM/DD/YYYY": count}, served from the daily rollup table
+    is_login, _ = check_login()
+    if not is_login:
+        return jsonify({"success": False, "message": "Not authorized"}), 401
+
+    success, data = response_cache.get_or_compute("auction_counts", request.args, lambda: get_auction_counts(
+        auction_type=request.args.get("auction_type"),
+        auction_status=request.args.get("auction_status"),
+        date_from=request.args.get("date_from"),
+        date_to=request.args.get("date_to"),
+        search=request.args.get("search"),
+        county=request.args.get("county"),
+        detail=request.args.get("detail") == "1"
+    ))
+    if success:
+        return jsonify(data), 200
+    return jsonify({"error": data}), 500
+
+
+@app.route('/api/auctions-by-date', methods=['GET'])
+def auctions_by_date():
+    is_login, _ = check_login()
+    if not is_login:
+        return jsonify({"success": False, "message": "Not authorized"}), 401
+
+    date = request.args.get("date")
+    if not date:
+        return jsonify({"success": False, "message": "date is required"}), 400
+
+    success, data = response_cache.get_or_compute(
+        "auctions-by-date", request.args, lambda: get_auctions_by_date(date, county=request.args.get("county"))
+    )
+    if success:
+        return jsonify({"success": True, "auctions": data}), 200
+    return jsonify({"success": False, "message": data}), 500
+
 
 @app.route('/api/auctions', methods=['GET'])
 def fetch_auctions():
@@ -250,16 +363,38 @@ def fetch_auctions():
     date_from = request.args.get("date_from")
     date_to = request.args.get("date_to")
     search = request.args.get("search")
+    county = request.args.get("county")
+
+    # Cursor mode: ?after_id=<next_cursor> / ?before_id=<prev_cursor> (or ?cursor=1 for the first page)
+    after_id = request.args.get("after_id", type=int)
+    before_id = request.args.get("before_id", type=int)
+    if after_id is not None or before_id is not None or request.args.get("cursor"):
+        success, data = response_cache.get_or_compute("auctions-page", request.args, lambda: get_auctions_page(
+            after_id=after_id,
+            before_id=before_id,
+            items_per_page=10,
+            auction_type=auction_type,
+            auction_status=auction_status,
+            date_from=date_from,
+            date_to=date_to,
+            search=search,
+            county=county,
+            with_total=request.args.get("with_total") == "1"
+        ))
+        if success:
+            return jsonify({"success": True, **data}), 200
+        return jsonify({"success": False, "message": data}), 500
 
-    success, data = get_filtered_auctions(
+    success, data = response_cache.get_or_compute("auctions", request.args, lambda: get_filtered_auctions(
         page=page,
         items_per_page=10,
         auction_type=auction_type,
         auction_status=auction_status,
         date_from=date_from,
         date_to=date_to,
-        search=search
-    )
+        search=search,
+        county=county
+    ))
 
     if success:
         return jsonify({"success": True, **data}), 200
@@ -268,61 +403,254 @@ def fetch_auctions():
 
 @app.route('/api/auctions/download', methods=['GET'])
 def download_auctions():
-    is_login = check_login()
+    is_login, _ = check_login()
     if not is_login:
         return jsonify({"success": False, "message": "Not authorized"}), 401
 
-    auction_type = request.args.get("auction_type")
-    auction_status = request.args.get("auction_status")
-    date_from = request.args.get("date_from")
-    date_to = request.args.get("date_to")
-    search = request.args.get("search")
-
-    success, data = get_filtered_auctions(
-        page=None,  # No pagination for download
-        items_per_page=None,
-        auction_type=auction_type,
-        auction_status=auction_status,
-        date_from=date_from,
-        date_to=date_to,
-        search=search
+    export_format = request.args.get("format", "csv").lower()
+    compress = request.args.get("gzip") == "1"
+
+    # Rows stream from a server-side cursor, so memory stays flat whatever the export size
+    rows = iter_filtered_auctions(
+        auction_type=request.args.get("auction_type"),
+        auction_status=request.args.get("auction_status"),
+        date_from=request.args.get("date_from"),
+        date_to=request.args.get("date_to"),
+        search=request.args.get("search"),
+        county=request.args.get("county")
     )
+    try:
+        first = next(rows, None)
+    except Exception as e:
+        return jsonify({"success": False, "message": str(e)}), 500
+    if first is None:
+        return jsonify({"success": False, "message": "No data to download"}), 404
 
-    if not success:
-        return jsonify({"success": False, "message": data}), 500
+    headers = list(EXPORT_COLUMNS)
+    rows = itertools.chain([first], rows)
+    stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
 
-    auctions = data["auctions"]
-    if not auctions:
-        return jsonify({"success": False, "message": "No data to download"}), 404
+    if export_format == "xlsx":
+        body = stream_xlsx(headers, rows)
+        filename = f"auctions_{stamp}.xlsx"
+        mimetype = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    else:
+        body = stream_csv(headers, rows)
+        filename = f"auctions_{stamp}.csv"
+        mimetype = "text/csv"
+
+    if compress:
+        body = gzip_chunks(body)
+        filename += ".gz"
+        mimetype = "application/gzip"
+
+    return Response(
+        stream_with_context(body),
+        mimetype=mimetype,
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
 
-    output = io.StringIO()
-    writer = csv.writer(output)
-    
-    # Write headers (assuming auctions table columns)
-    headers = auctions[0].keys()
+EXPORT_CHUNK_ROWS = 1000
+
+def stream_csv(headers, rows):
+    """Yield the CSV as utf-8 chunks of EXPORT_CHUNK_ROWS rows."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
     writer.writerow(headers)
-    
-    # Write data rows
-    for auction in auctions:
+    for count, auction in enumerate(rows, 1):
         writer.writerow([auction.get(header, "") for header in headers])
-
-    output.seek(0)
-    return send_file(
-        io.BytesIO(output.getvalue().encode('utf-8')),
-        mimetype='text/csv',
-        as_attachment=True,
-        download_name=f"auctions_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-    )
+        if count % EXPORT_CHUNK_ROWS == 0:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate(0)
+    if buffer.tell():
+        yield buffer.getvalue().encode('utf-8')
+
+def stream_xlsx(headers, rows, chunk_size=64 * 1024):
+    """
+    Write rows into a write-only openpyxl workbook (constant memory) saved to a
+    temp file, then yield the file in chunks. An xlsx is a zip, so it can only
+    be sent once the workbook is complete.
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Auctions")
+    sheet.append(headers)
+    for auction in rows:
+        sheet.append([auction.get(header) for header in headers])
+
+    fd, path = tempfile.mkstemp(suffix=".xlsx")
+    os.close(fd)
+    try:
+        workbook.save(path)
+        with open(path, "rb") as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+    finally:
+        os.remove(path)
+
+def gzip_chunks(chunks):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31 -> gzip container
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
 
 # scraper code
+# Scheduled and manual runs share one warm, logged-in browser unless disabled
+USE_WARM_BROWSER = os.getenv("SCRAPER_WARM_BROWSER", "1") == "1"
+
 def run_scraper():
     try:
-        auctions_inserted = run_external_scraper()
+        auctions_inserted = run_all_counties(use_warm_browser=USE_WARM_BROWSER)
         update_scraper_log(datetime.now(), auctions_inserted, "Success", "")
         logger.info("Scraper ran successfully")
+        return auctions_inserted, None
     except Exception as e:
         update_scraper_log(datetime.now(), 0, "Failed", str(e))
         logger.error(f"Scraper error: {e}")
+        return 0, str(e)
+
+
+# Scraper jobs: runs go to a single background worker so requests return
+# right away, and only one run can be queued or running at a time. Within a
+# process active_job_id guards it, across gunicorn workers the MySQL lock does
+scraper_executor = ThreadPoolExecutor(max_workers=1)
+scraper_jobs = {}
+scraper_jobs_lock = threading.Lock()
+active_job_id = None
+MAX_FINISHED_JOBS = 20
+
+def submit_scraper_job(trigger):
+    """
+    Queue a scraper run. Returns (job, None), or (None, running_job) if a run
+    is already queued or running. A run in another process has no job here,
+    running_job is then {"id": None, "status": "running"}.
+    """
+    global active_job_id
+    with scraper_jobs_lock:
+        if active_job_id:
+            return None, dict(scraper_jobs[active_job_id])
+        lock_conn = acquire_scraper_lock()
+        if lock_conn is None:
+            return None, {"id": None, "status": "running"}
+
+        job_id = uuid.uuid4().hex
+        scraper_jobs[job_id] = {
+            "id": job_id,
+            "trigger": trigger,
+            "status": "queued",
+            "phase": "queued",
+            "progress": {},
+            "submitted_at": str(datetime.now()),
+            "started_at": None,
+            "finished_at": None,
+            "auctions": None,
+            "error": None,
+        }
+        active_job_id = job_id
+
+        # Drop the oldest finished jobs
+        finished = [jid for jid, job in scraper_jobs.items() if job["status"] in ("success", "failed")]
+        for jid in finished[:-MAX_FINISHED_JOBS]:
+            del scraper_jobs[jid]
+        job = dict(scraper_jobs[job_id])
+
+    emit_scraper_job(job_id)
+    scraper_executor.submit(run_scraper_job, job_id, lock_conn)
+    return job, None
+
+def run_scraper_job(job_id, lock_conn):
+    global active_job_id
+    with scraper_jobs_lock:
+        scraper_jobs[job_id].update(status="running", phase="starting", started_at=str(datetime.now()))
+    emit_scraper_job(job_id)
+    try:
+        auctions, error = run_scraper()
+    except Exception as e:
+        auctions, error = 0, str(e)
+    try:
+        release_scraper_lock(lock_conn)
+    except Exception as e:
+        logger.error(f"Error releasing the scraper lock: {e}")
+    with scraper_jobs_lock:
+        scraper_jobs[job_id].update(
+            status="failed" if error else "success",
+            phase="finished",
+            finished_at=str(datetime.now()),
+            auctions=auctions,
+            error=error,
+        )
+        active_job_id = None
+    emit_scraper_job(job_id)
+
+def track_scraper_progress(event):
+    """Progress listener: keep the latest event per county on the active job."""
+    with scraper_jobs_lock:
+        if not active_job_id:
+            return
+        job = scraper_jobs[active_job_id]
+        job["phase"] = event["phase"]
+        county = event.get("county") or "all"
+        job["progress"][county] = {**job["progress"].get(county, {}), **event}
+
+add_progress_listener(track_scraper_progress)
+
+# Last "extracting" push per county, those events fire once per auction
+last_extracting_emit = {}
+EXTRACTING_EMIT_INTERVAL = 0.5
+
+def push_scraper_progress(event):
+    """Progress listener: push events to dashboard clients on /scraper."""
+    if event["phase"] == "extracting" and event.get("extracted") != event.get("total"):
+        county = event.get("county") or "all"
+        now = event["time"]
+        if now - last_extracting_emit.get(county, 0) < EXTRACTING_EMIT_INTERVAL:
+            return
+        last_extracting_emit[county] = now
+    socketio.emit("scraper_progress", {**event, "job_id": active_job_id}, namespace="/scraper")
+
+add_progress_listener(push_scraper_progress)
+
+def invalidate_on_scraper_write(event):
+    """Progress listener: drop cached auction responses as soon as a writer batch changed rows."""
+    if event["phase"] == "saving" and event.get("changed"):
+        invalidate_auction_caches()
+
+add_progress_listener(invalidate_on_scraper_write)
+
+def emit_scraper_job(job_id):
+    job = get_scraper_job(job_id)
+    if job:
+        socketio.emit("scraper_job", job, namespace="/scraper")
+
+
+@socketio.on("connect", namespace="/scraper")
+def scraper_socket_connect(auth=None):
+    is_login, _ = check_login()
+    if not is_login:
+        return False  # reject the connection (also covers revoked tokens)
+    job = get_scraper_job()
+    if job:
+        socketio.emit("scraper_job", job, namespace="/scraper", to=request.sid)
+
+def get_scraper_job(job_id=None):
+    """A copy of the given job, or of the active/most recent one."""
+    with scraper_jobs_lock:
+        if job_id is None:
+            job_id = active_job_id or next(reversed(scraper_jobs), None)
+        job = scraper_jobs.get(job_id)
+        if job is None:
+            return None
+        return {**job, "progress": {county: dict(event) for county, event in job["progress"].items()}}
+
+def run_scheduled_scraper():
+    job, running = submit_scraper_job("schedule")
+    if not job:
+        logger.info(f"Scheduled run skipped, job {running['id'] or 'of another worker'} is still running")
 
 def schedule_scraper():
     try:
@@ -344,7 +672,7 @@ def schedule_scraper():
                 
                 if parsed_next_run_time > datetime.now():
                     scheduler.add_job(
-                        run_scraper,
+                        run_scheduled_scraper,
                         trigger=DateTrigger(run_date=parsed_next_run_time),
                         id="next_run"
                     )
@@ -356,7 +684,7 @@ def schedule_scraper():
             try:
                 hour, minute = map(int, result["daily_run_time"].split(":"))
                 scheduler.add_job(
-                    run_scraper,
+                    run_scheduled_scraper,
                     trigger=CronTrigger(hour=hour, minute=minute),
                     id="daily_run"
                 )
@@ -374,6 +702,7 @@ def get_scraper_details_route():
         if not is_login:
             return jsonify({"success": False, "message": "Not authorized"}), 401
         result = get_scraper_details()
+        progress = get_scraper_progress()
         return jsonify({
             "success": True,
             "last_run_time": str(result["last_run_time"]) if result["last_run_time"] else None,
@@ -385,24 +714,69 @@ def get_scraper_details_route():
             "next_run_from": str(result["next_run_from"]) if result["next_run_from"] else None,
             "next_run_to": str(result["next_run_to"]) if result["next_run_to"] else None,
             "daily_run_from": str(result["daily_run_from"]) if result["daily_run_from"] else None,
-            "daily_run_to": str(result["daily_run_to"]) if result["daily_run_to"] else None
+            "daily_run_to": str(result["daily_run_to"]) if result["daily_run_to"] else None,
+            "progress": {
+                "run_key": progress["run_key"],
+                "status": progress["status"],
+                "total_links": progress["total_links"],
+                "done_links": progress["done_links"],
+                "started_at": str(progress["started_at"]) if progress["started_at"] else None,
+                "updated_at": str(progress["updated_at"]) if progress["updated_at"] else None
+            } if progress else None
         })
     except Exception as e:
         logger.error(f"Error fetching scraper details: {e}")
         return jsonify({"success": False, "message": "Failed to fetch scraper details"}), 500
     
     
+@app.route("/api/scraper/browser", methods=["GET"])
+def get_scraper_browser_health():
+    try:
+        is_login, _ = check_login()
+        if not is_login:
+            return jsonify({"success": False, "message": "Not authorized"}), 401
+        if not USE_WARM_BROWSER:
+            return jsonify({"success": True, "enabled": False})
+        county = request.args.get("county")
+        if county and county.lower() not in get_counties():
+            return jsonify({"success": False, "message": "Unknown county"}), 400
+        return jsonify({"success": True, "enabled": True, **get_browser_service(county).health_check()})
+    except Exception as e:
+        logger.error(f"Error checking scraper browser: {e}")
+        return jsonify({"success": False, "message": str(e)}), 500
+
+
 @app.route("/api/scraper/start", methods=["POST"])
 def start_scraper():
     try:
         is_login, _ = check_login()
         if not is_login:
             return jsonify({"success": False, "message": "Not authorized"}), 401
-        run_scraper()
-        return jsonify({"success": True})
+        job, running = submit_scraper_job("manual")
+        if not job:
+            return jsonify({
+                "success": False,
+                "message": "Scraper is already running",
+                "job_id": running["id"]
+            }), 409
+        return jsonify({"success": True, "job_id": job["id"], "status": job["status"]}), 202
     except Exception as e:
         logger.error(f"Error starting scraper: {e}")
         return jsonify({"success": False, "message": str(e)}), 500
+
+
+@app.route("/api/scraper/jobs/<job_id>", methods=["GET"])
+@app.route("/api/scraper/status", methods=["GET"])
+def get_scraper_job_status(job_id=None):
+    is_login, _ = check_login()
+    if not is_login:
+        return jsonify({"success": False, "message": "Not authorized"}), 401
+    job = get_scraper_job(job_id)
+    if job is None:
+        if job_id:
+            return jsonify({"success": False, "message": "Job not found"}), 404
+        return jsonify({"success": True, "job": None}), 200
+    return jsonify({"success": True, "job": job}), 200
     
     
 @app.route("/api/scraper/schedule", methods=["POST"])
@@ -511,4 +885,4 @@ def set_daily_run_range():
 
 if __name__ == '__main__':
     schedule_scraper()
-    app.run(debug=True)
+    socketio.run(app, debug=True)
@@ -0,0 +1,155 @@
+"""
+Auth helpers for the API: a cache of verified JWTs with a revocation list,
+and a rate limiter for login attempts.
+
+Tokens are cached by their sha256 until their own exp claim, so a burst of
+dashboard requests decodes each cookie once. Logging out revokes the token
+hash; revocations can be persisted (load_revoked/save_revoked) so other
+workers pick them up within `refresh` seconds.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict, deque
+
+import jwt
+
+
+def token_hash(token):
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class TokenVerifier:
+
+    def __init__(self, secret, algorithms=("HS256",), max_entries=10000,
+                 load_revoked=None, save_revoked=None, refresh=30):
+        self.secret = secret
+        self.algorithms = list(algorithms)
+        self.max_entries = max_entries
+        self.load_revoked = load_revoked
+        self.save_revoked = save_revoked
+        self.refresh = refresh
+        self.lock = threading.Lock()
+        self.verified = OrderedDict()   # token hash -> (claims, exp)
+        self.revoked = {}               # token hash -> exp
+        self.last_refresh = 0
+        self.stats = {"hits": 0, "decodes": 0, "rejected": 0}
+
+    def _refresh_revoked(self, now):
+        if not self.load_revoked:
+            return
+        # Check and claim the refresh in one step, so concurrent requests don't all load
+        with self.lock:
+            if now - self.last_refresh < self.refresh:
+                return
+            self.last_refresh = now
+        try:
+            revoked = self.load_revoked()
+        except Exception as e:
+            print("Error loading revoked tokens ", e)
+            return
+        with self.lock:
+            self.revoked.update(revoked)
+            for digest in revoked:
+                self.verified.pop(digest, None)
+
+    def verify(self, token):
+        """Claims of a valid, unrevoked token, else None."""
+        now = time.time()
+        self._refresh_revoked(now)
+        digest = token_hash(token)
+
+        with self.lock:
+            if digest in self.revoked:
+                self.stats["rejected"] += 1
+                return None
+            cached = self.verified.get(digest)
+            if cached is not None:
+                claims, exp = cached
+                if exp > now:
+                    self.verified.move_to_end(digest)
+                    self.stats["hits"] += 1
+                    return claims
+                del self.verified[digest]
+
+        try:
+            claims = jwt.decode(token, self.secret, algorithms=self.algorithms)
+        except jwt.InvalidTokenError:  # includes ExpiredSignatureError
+            with self.lock:
+                self.stats["rejected"] += 1
+            return None
+
+        with self.lock:
+            self.stats["decodes"] += 1
+            # Tokens without exp are still re-checked once a day
+            self.verified[digest] = (claims, claims.get("exp") or now + 86400)
+            while len(self.verified) > self.max_entries:
+                self.verified.popitem(last=False)
+        return claims
+
+    def revoke(self, token):
+        """Invalidate a token until it would have expired anyway."""
+        digest = token_hash(token)
+        try:
+            exp = jwt.decode(token, self.secret, algorithms=self.algorithms).get("exp")
+        except jwt.InvalidTokenError:
+            return False  # expired or forged, nothing to revoke
+        exp = exp or time.time() + 86400
+        with self.lock:
+            self.verified.pop(digest, None)
+            self.revoked[digest] = exp
+            now = time.time()
+            for key in [key for key, until in self.revoked.items() if until < now]:
+                del self.revoked[key]
+        if self.save_revoked:
+            try:
+                self.save_revoked(digest, exp)
+            except Exception as e:
+                print("Error saving revoked token ", e)
+        return True
+
+
+class LoginRateLimiter:
+    """
+    Sliding-window limit on failed logins per key (client IP, email).
+    Checked before the password hash is computed, so a brute-force run is
+    turned away without spending CPU on PBKDF2.
+    """
+
+    def __init__(self, max_failures=5, window=900):
+        self.max_failures = max_failures
+        self.window = window
+        self.lock = threading.Lock()
+        self.failures = {}   # key -> deque of failure timestamps
+
+    def _prune(self, key, now):
+        attempts = self.failures.get(key)
+        while attempts and attempts[0] <= now - self.window:
+            attempts.popleft()
+        if attempts is not None and not attempts:
+            del self.failures[key]
+            return None
+        return attempts
+
+    def retry_after(self, key):
+        """Seconds until `key` may try again, 0 if it isn't limited."""
+        now = time.time()
+        with self.lock:
+            attempts = self._prune(key, now)
+            if not attempts or len(attempts) < self.max_failures:
+                return 0
+            return int(attempts[0] + self.window - now) + 1
+
+    def failure(self, key):
+        now = time.time()
+        with self.lock:
+            self._prune(key, now)
+            self.failures.setdefault(key, deque()).append(now)
+            if len(self.failures) > 100000:
+                # Bound memory under a spray of random keys
+                for stale in [k for k, v in self.failures.items() if v[-1] <= now - self.window]:
+                    del self.failures[stale]
+
+    def reset(self, key):
+        with self.lock:
+            self.failures.pop(key, None)
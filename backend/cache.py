@@ -0,0 +1,220 @@
+"""
+Response cache for the auction read endpoints.
+
+Entries are keyed by endpoint + normalized query parameters and tagged with
+the cache generation they were computed in. Writers call bump() after
+changing the data (the scraper's DB writer, user edits), which makes every
+older entry stale at once, so invalidation is exact and no TTL has to expire.
+The TTL only bounds how long an entry lives without a bump.
+
+    cache = ResponseCache(ttl=300)
+    data = cache.get_or_compute("auction_counts", request.args, lambda: get_auction_counts(...))
+
+By default entries live in this process (LRU). With directory=... the
+entries and the generation are kept on disk, so every gunicorn worker on the
+host shares them.
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+
+def normalize_params(params):
+    """Sorted (key, value) pairs with blank values dropped, so '?a=1&b=' and '?b=&a=1 ' share an entry."""
+    items = params.items(multi=True) if hasattr(params, "getlist") else params.items()
+    normalized = []
+    for key, value in items:
+        if value is None:
+            continue
+        value = str(value).strip()
+        if value != "":
+            normalized.append((key, value))
+    return tuple(sorted(normalized))
+
+
+class MemoryBackend:
+    """Per-process LRU store."""
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.current = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+            return entry
+
+    def set(self, key, entry):
+        """Store (value, expires_at, generation); returns the number of evicted entries."""
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            evicted = 0
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                evicted += 1
+            return evicted
+
+    def delete(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def generation(self):
+        return self.current
+
+    def bump(self):
+        with self.lock:
+            self.current += 1
+            # Everything stored so far is stale now
+            self.entries.clear()
+            return self.current
+
+
+class FileBackend:
+    """
+    Store shared by every process on the host: one pickle per entry, written
+    atomically. The generation is the size of an append-only file, so a bump
+    from any worker is a single O_APPEND write and reading it is one stat().
+
+    Unpickling runs code, so the directory must be private to this user: it is
+    created 0700, tightened to 0700 if we own it, and refused if someone else does.
+    """
+
+    def __init__(self, directory, max_entries=2048):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.generation_path = os.path.join(directory, "generation")
+        self.sets = 0
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        self._check_private()
+
+    def _check_private(self):
+        if not hasattr(os, "getuid"):
+            return
+        info = os.stat(self.directory)
+        if info.st_uid != os.getuid():
+            raise PermissionError(f"Response cache directory {self.directory} is not owned by this user")
+        if info.st_mode & 0o077:
+            os.chmod(self.directory, 0o700)
+
+    def _path(self, key):
+        return os.path.join(self.directory, hashlib.sha1(repr(key).encode()).hexdigest() + ".pkl")
+
+    def get(self, key):
+        try:
+            with open(self._path(key), "rb") as f:
+                stored_key, entry = pickle.load(f)
+        except (OSError, EOFError, pickle.PickleError):
+            return None
+        return entry if stored_key == key else None
+
+    def set(self, key, entry):
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((key, entry), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, self._path(key))
+        self.sets += 1
+        # Trimming needs a directory scan, so only do it every 100 writes
+        return self._trim() if self.sets % 100 == 0 else 0
+
+    def _trim(self):
+        files = [
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory) if name.endswith(".pkl")
+        ]
+        if len(files) <= self.max_entries:
+            return 0
+        files.sort(key=lambda path: os.path.getmtime(path))
+        evicted = 0
+        for path in files[:len(files) - self.max_entries]:
+            try:
+                os.remove(path)
+                evicted += 1
+            except OSError:
+                pass
+        return evicted
+
+    def delete(self, key):
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def generation(self):
+        try:
+            return os.stat(self.generation_path).st_size
+        except OSError:
+            return 0
+
+    def bump(self):
+        fd = os.open(self.generation_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+        try:
+            os.write(fd, b".")
+        finally:
+            os.close(fd)
+        return self.generation()
+
+
+class ResponseCache:
+
+    def __init__(self, ttl=300, max_entries=512, directory=None):
+        self.ttl = ttl
+        self.backend = FileBackend(directory, max_entries) if directory else MemoryBackend(max_entries)
+        self.stats_lock = threading.Lock()
+        self.counters = {"hits": 0, "misses": 0, "stale": 0, "expired": 0, "evictions": 0, "bumps": 0}
+
+    def _count(self, name, amount=1):
+        with self.stats_lock:
+            self.counters[name] += amount
+
+    def get_or_compute(self, namespace, params, compute):
+        """
+        Cached value for (namespace, params), computing and storing it on a miss.
+        compute() returns (success, data) like the dbhandler functions; failures aren't cached.
+        """
+        key = (namespace, normalize_params(params or {}))
+        generation = self.backend.generation()
+        entry = self.backend.get(key)
+        if entry is not None:
+            value, expires_at, entry_generation = entry
+            if entry_generation != generation:
+                self._count("stale")
+            elif expires_at < time.time():
+                self._count("expired")
+            else:
+                self._count("hits")
+                return value
+            self.backend.delete(key)
+
+        self._count("misses")
+        value = compute()
+        if not isinstance(value, tuple) or value[0]:
+            evicted = self.backend.set(key, (value, time.time() + self.ttl, generation))
+            if evicted:
+                self._count("evictions", evicted)
+        return value
+
+    def bump(self):
+        """Invalidate everything cached so far."""
+        self._count("bumps")
+        return self.backend.bump()
+
+    def stats(self):
+        with self.stats_lock:
+            counters = dict(self.counters)
+        lookups = counters["hits"] + counters["misses"]
+        return {
+            **counters,
+            "hit_rate": round(counters["hits"] / lookups, 4) if lookups else 0.0,
+            "generation": self.backend.generation(),
+            "backend": type(self.backend).__name__,
+            "ttl": self.ttl,
+        }
@@ -2,8 +2,11 @@ from werkzeug.security import generate_password_hash
 import pymysql
 import re
 import os
+import time
+from datetime import datetime
 from werkzeug.security import check_password_hash
 from dotenv import load_dotenv
+from dbpool import ConnectionPool
 
 # Load environment variables from .env file
 load_dotenv()
@@ -13,7 +16,24 @@ DB_USER = os.getenv('DB_USER')
 DB_PASSWORD = os.getenv('DB_PASSWORD')
 DB_NAME = os.getenv('DB_NAME')
 
+# Pooled connections for DB_NAME; close() returns them to the pool
+pool = ConnectionPool(
+    host=DB_HOST,
+    user=DB_USER,
+    password=DB_PASSWORD,
+    database=DB_NAME,
+    cursorclass=pymysql.cursors.DictCursor,
+    charset='utf8mb4',
+    max_size=int(os.getenv("DB_POOL_SIZE", "10")),
+    timeout=int(os.getenv("DB_POOL_TIMEOUT", "10")),
+    recycle=int(os.getenv("DB_POOL_RECYCLE", "3600")),
+    leak_timeout=int(os.getenv("DB_POOL_LEAK_TIMEOUT", "120"))
+)
+
 def get_connection(db=None):
+    if db == DB_NAME:
+        return pool.connection()
+    # Server-level connection (e.g. CREATE DATABASE) before DB_NAME exists
     return pymysql.connect(
         host=DB_HOST,
         user=DB_USER,
@@ -57,14 +77,59 @@ def create_database_and_table():
                     PropertyAddress VARCHAR(255),
                     AuctionType VARCHAR(255),
                     CaseNo VARCHAR(255),
-                    FinalJudgementAmount VARCHAR(255),
+                    FinalJudgementAmount DECIMAL(14,2) NULL,
                     ParcelID VARCHAR(255),
                     AuctionDate VARCHAR(100),
-                    AuctionSoldAmount VARCHAR(100),
+                    AuctionDateTime DATETIME NULL,
+                    AuctionSoldAmount DECIMAL(14,2) NULL,
                     SoldTo VARCHAR(255),
                     PlaintiffMaxBid VARCHAR(255),
                     AuctionStatus VARCHAR(100),
-                    Link VARCHAR(2083) UNIQUE
+                    Link VARCHAR(2083) UNIQUE,
+                    AID BIGINT NULL,
+                    CaseNoKey VARCHAR(64),
+                    ParcelKey VARCHAR(64),
+                    GridHash CHAR(40),
+                    County VARCHAR(50),
+                    INDEX idx_auctions_county (County),
+                    INDEX idx_auctions_aid (AID),
+                    INDEX idx_auctions_datetime (AuctionDateTime),
+                    INDEX idx_auctions_status_date (AuctionStatus, AuctionDateTime),
+                    INDEX idx_auctions_type_date (AuctionType, AuctionDateTime),
+                    INDEX idx_auctions_caseno_key (CaseNoKey),
+                    INDEX idx_auctions_parcel_key (ParcelKey),
+                    FULLTEXT INDEX ft_auctions_address (PropertyAddress)
+                )CHARACTER SET utf8mb4;
+            """)
+        migrate_auctions_schema(conn)
+        with conn.cursor() as cursor:
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS auction_daily_rollup (
+                    AuctionDay DATE NOT NULL,
+                    County VARCHAR(50) NOT NULL DEFAULT '',
+                    AuctionStatus VARCHAR(100) NOT NULL DEFAULT '',
+                    AuctionType VARCHAR(255) NOT NULL DEFAULT '',
+                    auction_count INT NOT NULL DEFAULT 0,
+                    total_judgment DECIMAL(16,2) NULL,
+                    total_sold DECIMAL(16,2) NULL,
+                    PRIMARY KEY (AuctionDay, County, AuctionStatus, AuctionType)
+                )CHARACTER SET utf8mb4;
+            """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS schema_migrations (
+                    name VARCHAR(64) NOT NULL,
+                    applied_at DATETIME NOT NULL,
+                    PRIMARY KEY (name)
+                )CHARACTER SET utf8mb4;
+            """)
+        rebuild_daily_rollup(conn)
+        with conn.cursor() as cursor:
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS revoked_tokens (
+                    token_hash CHAR(64) NOT NULL,
+                    expires_at DATETIME NOT NULL,
+                    PRIMARY KEY (token_hash),
+                    INDEX idx_revoked_tokens_expires (expires_at)
                 )CHARACTER SET utf8mb4;
             """)
         with conn.cursor() as cursor:
@@ -85,6 +150,23 @@ def create_database_and_table():
                 )CHARACTER SET utf8mb4;
             """)
         
+        with conn.cursor() as cursor:
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS scraper_checkpoints (
+                    run_key VARCHAR(64) NOT NULL,
+                    date_from DATE DEFAULT NULL,
+                    date_to DATE DEFAULT NULL,
+                    status VARCHAR(20) NOT NULL,
+                    total_links INT NOT NULL DEFAULT 0,
+                    done_links INT NOT NULL DEFAULT 0,
+                    grid_rows LONGTEXT,
+                    done_aids LONGTEXT,
+                    started_at DATETIME DEFAULT NULL,
+                    updated_at DATETIME DEFAULT NULL,
+                    PRIMARY KEY (run_key)
+                )CHARACTER SET utf8mb4;
+            """)
+
         with conn.cursor() as cursor:
             cursor.execute("""
                 INSERT INTO scraper_logs (
@@ -100,6 +182,173 @@ def create_database_and_table():
     finally:
         conn.close()
 
+def column_type(cursor, table, column):
+    cursor.execute("""
+        SELECT DATA_TYPE AS data_type FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s
+    """, (table, column))
+    row = cursor.fetchone()
+    return row["data_type"].lower() if row else None
+
+def index_exists(cursor, table, index_name):
+    cursor.execute("""
+        SELECT 1 FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s
+        LIMIT 1
+    """, (table, index_name))
+    return cursor.fetchone() is not None
+
+def migrate_auctions_schema(conn):
+    """
+    Bring an existing auctions table onto the typed schema:
+        - AuctionDateTime (DATETIME) parsed from the 'MM/DD/YYYY HH:MM AM ET' AuctionDate text
+        - AID (BIGINT) parsed from the Link query string
+        - FinalJudgementAmount / AuctionSoldAmount converted from '$1,234.56' text to DECIMAL
+        - composite indexes for the status/type + date filters
+        - CaseNoKey / ParcelKey search keys and the PropertyAddress FULLTEXT index
+        - County (existing rows are Broward's) and its index
+    Safe to run on every start; each step is skipped once it has been applied.
+    """
+    with conn.cursor() as cursor:
+        if column_type(cursor, "auctions", "AuctionDateTime") is None:
+            cursor.execute("ALTER TABLE auctions ADD COLUMN AuctionDateTime DATETIME NULL AFTER AuctionDate")
+        cursor.execute("""
+            UPDATE auctions
+            SET AuctionDateTime = STR_TO_DATE(SUBSTRING_INDEX(AuctionDate, ' ET', 1), '%m/%d/%Y %h:%i %p')
+            WHERE AuctionDateTime IS NULL
+              AND AuctionDate REGEXP '^[0-9]{2}/[0-9]{2}/[0-9]{4} [0-9]{1,2}:[0-9]{2} (AM|PM)'
+        """)
+
+        if column_type(cursor, "auctions", "AID") is None:
+            cursor.execute("ALTER TABLE auctions ADD COLUMN AID BIGINT NULL AFTER Link")
+        cursor.execute("""
+            UPDATE auctions
+            SET AID = CAST(SUBSTRING_INDEX(SUBSTRING_INDEX(Link, 'AID=', -1), '&', 1) AS UNSIGNED)
+            WHERE AID IS NULL AND Link REGEXP 'AID=[0-9]+'
+        """)
+
+        for column in ("FinalJudgementAmount", "AuctionSoldAmount"):
+            if column_type(cursor, "auctions", column) == "decimal":
+                continue
+            cursor.execute(f"UPDATE auctions SET {column} = REPLACE(REPLACE(TRIM({column}), '$', ''), ',', '')")
+            cursor.execute(f"UPDATE auctions SET {column} = NULL WHERE {column} NOT REGEXP '^-?[0-9]+([.][0-9]+)?$'")
+            cursor.execute(f"ALTER TABLE auctions MODIFY {column} DECIMAL(14,2) NULL")
+
+        for column in ("CaseNoKey", "ParcelKey"):
+            if column_type(cursor, "auctions", column) is None:
+                cursor.execute(f"ALTER TABLE auctions ADD COLUMN {column} VARCHAR(64)")
+        backfill_search_keys(cursor)
+
+        if column_type(cursor, "auctions", "County") is None:
+            cursor.execute("ALTER TABLE auctions ADD COLUMN County VARCHAR(50)")
+            # Rows from before multi-county support all came from Broward
+            cursor.execute("UPDATE auctions SET County = 'broward' WHERE County IS NULL")
+
+        indexes = {
+            "idx_auctions_aid": "AID",
+            "idx_auctions_datetime": "AuctionDateTime",
+            "idx_auctions_status_date": "AuctionStatus, AuctionDateTime",
+            "idx_auctions_type_date": "AuctionType, AuctionDateTime",
+            "idx_auctions_caseno_key": "CaseNoKey",
+            "idx_auctions_parcel_key": "ParcelKey",
+            "idx_auctions_county": "County",
+        }
+        for index_name, columns in indexes.items():
+            if not index_exists(cursor, "auctions", index_name):
+                cursor.execute(f"ALTER TABLE auctions ADD INDEX {index_name} ({columns})")
+        if not index_exists(cursor, "auctions", "ft_auctions_address"):
+            cursor.execute("ALTER TABLE auctions ADD FULLTEXT INDEX ft_auctions_address (PropertyAddress)")
+    conn.commit()
+
+def rebuild_daily_rollup(conn, force=False):
+    """
+    Fill auction_daily_rollup from the auctions table in one pass.
+    Runs once, recorded as the 'daily_rollup_rebuilt' row of schema_migrations, unless force is set;
+    after that the scraper keeps it current per affected day and county. An empty rollup isn't
+    a usable signal: a scraper batch saved before the first rebuild leaves a few rows in it.
+    """
+    with conn.cursor() as cursor:
+        if not force:
+            cursor.execute("SELECT 1 FROM schema_migrations WHERE name = 'daily_rollup_rebuilt'")
+            if cursor.fetchone():
+                return
+        cursor.execute("DELETE FROM auction_daily_rollup")
+        cursor.execute("""
+            INSERT INTO auction_daily_rollup
+                (AuctionDay, County, AuctionStatus, AuctionType, auction_count, total_judgment, total_sold)
+            SELECT DATE(AuctionDateTime), COALESCE(County, ''), COALESCE(AuctionStatus, ''), COALESCE(AuctionType, ''),
+                   COUNT(*), SUM(FinalJudgementAmount), SUM(AuctionSoldAmount)
+            FROM auctions
+            WHERE AuctionDateTime IS NOT NULL
+            GROUP BY DATE(AuctionDateTime), COALESCE(County, ''), COALESCE(AuctionStatus, ''), COALESCE(AuctionType, '')
+        """)
+        cursor.execute("REPLACE INTO schema_migrations (name, applied_at) VALUES ('daily_rollup_rebuilt', NOW())")
+    conn.commit()
+
+def search_key(value):
+    """Normalized lookup key for case numbers / parcel ids: '06-2023-CA-001234' -> '062023CA001234'."""
+    return re.sub(r"[^0-9A-Z]", "", (value or "").upper())[:64] or None
+
+def backfill_search_keys(cursor, batch_size=1000):
+    """Fill CaseNoKey / ParcelKey for rows written before the columns existed."""
+    while True:
+        cursor.execute("""
+            SELECT id, CaseNo, ParcelID FROM auctions
+            WHERE CaseNoKey IS NULL AND ParcelKey IS NULL
+              AND (COALESCE(CaseNo, '') <> '' OR COALESCE(ParcelID, '') <> '')
+            LIMIT %s
+        """, (batch_size,))
+        rows = cursor.fetchall()
+        if not rows:
+            return
+        cursor.executemany(
+            "UPDATE auctions SET CaseNoKey = %s, ParcelKey = %s WHERE id = %s",
+            [(search_key(row["CaseNo"]) or "", search_key(row["ParcelID"]) or "", row["id"]) for row in rows]
+        )
+
+# InnoDB skips FULLTEXT tokens shorter than innodb_ft_min_token_size (3 by default)
+FULLTEXT_MIN_TOKEN = int(os.getenv("FULLTEXT_MIN_TOKEN", "3"))
+
+def build_search_filter(search):
+    """
+    Indexed search over address, case number and parcel id.
+        - address: FULLTEXT boolean match, every token required, last token as a prefix.
+          Tokens shorter than FULLTEXT_MIN_TOKEN aren't in the index, each one is
+          checked with a LIKE on the rows the match returns
+          ('123 main st' -> '+123 +main*' AND PropertyAddress LIKE '%st%')
+        - case number / parcel id: prefix match on the normalized keys
+          ('06-2023-CA' -> CaseNoKey LIKE '062023CA%')
+    When both apply the matches are unioned by id, so each branch keeps its own index.
+    Returns: (where, params) with where starting with ' AND'
+    """
+    tokens = re.findall(r"[0-9A-Za-z]+", search)
+    words = [token for token in tokens if len(token) >= FULLTEXT_MIN_TOKEN]
+    short_words = [token for token in tokens if len(token) < FULLTEXT_MIN_TOKEN]
+    key = search_key(search)
+
+    branches = []
+    params = []
+    if words:
+        boolean_query = " ".join(f"+{word}" for word in words[:-1])
+        boolean_query = f"{boolean_query} +{words[-1]}*".strip()
+        branch = "SELECT id FROM auctions WHERE MATCH(PropertyAddress) AGAINST (%s IN BOOLEAN MODE)"
+        branch += " AND PropertyAddress LIKE %s" * len(short_words)
+        branches.append(branch)
+        params.append(boolean_query)
+        params.extend(f"%{word}%" for word in short_words)
+    if key and any(ch.isdigit() for ch in key):
+        branches.append("SELECT id FROM auctions WHERE CaseNoKey LIKE %s")
+        branches.append("SELECT id FROM auctions WHERE ParcelKey LIKE %s")
+        params.extend([f"{key}%", f"{key}%"])
+
+    if not branches:
+        # Too short for either index (e.g. 'st'); a prefix LIKE is the best we can do
+        return " AND PropertyAddress LIKE %s", [f"{search.strip()}%"]
+    if len(branches) == 1:
+        condition = branches[0].split(" WHERE ", 1)[1]
+        return f" AND {condition}", params
+    return f" AND id IN (SELECT id FROM ({' UNION '.join(branches)}) AS search_matches)", params
+
 def validate_email(email):
     # Simple regex for email validation
     email_regex = r"^[\w\.-]+@[\w\.-]+\.\w+$"
@@ -109,7 +358,7 @@ def get_user_by_email(email):
     conn = get_connection(DB_NAME)
     try:
         with conn.cursor() as cursor:
-            sql = "SELECT * FROM users WHERE email = %s"
+            sql = "SELECT email, username, role, password_hash FROM users WHERE email = %s"
             cursor.execute(sql, (email,))
             user = cursor.fetchone()
             return user
@@ -172,6 +421,7 @@ def get_all_users():
         
 
 def update_user(user_id, name=None, email=None, dob=None, role=None):
+    conn = None
     try:
         conn = get_connection(DB_NAME)
         with conn.cursor() as cursor:
@@ -200,67 +450,82 @@ def update_user(user_id, name=None, email=None, dob=None, role=None):
 
             cursor.execute(sql, tuple(values))
         conn.commit()
-        conn.close()
         return True, None
     except Exception as e:
         return False, str(e)
+    finally:
+        if conn:
+            conn.close()
 
 def delete_user(user_id):
+    conn = None
     try:
         conn = get_connection(DB_NAME)
         with conn.cursor() as cursor:
             cursor.execute("DELETE FROM users WHERE id=%s", (user_id,))
         conn.commit()
-        conn.close()
         return True, None
     except Exception as e:
         return False, str(e)
+    finally:
+        if conn:
+            conn.close()
     
     
 def get_user_by_id(user_id):
 
+    conn = None
     try:
         conn = get_connection(DB_NAME)
         with conn.cursor() as cursor:
             sql = "SELECT id, username, email, dob, role FROM users WHERE id=%s"
             cursor.execute(sql, (user_id,))
             user = cursor.fetchone()
-        conn.close()
         if user:
             return True, user
         else:
             return False, "User not found"
     except Exception as e:
         return False, str(e)
+    finally:
+        if conn:
+            conn.close()
 
 def get_total_users():
    
+    conn = None
     try:
         conn = get_connection(DB_NAME)
         with conn.cursor() as cursor:
             cursor.execute("SELECT COUNT(*) AS total FROM users")
             result = cursor.fetchone()
-        conn.close()
         return True, result['total']
     except Exception as e:
         return False, str(e)
+    finally:
+        if conn:
+            conn.close()
 
 def get_total_auctions():
     
+    conn = None
     try:
         conn = get_connection(DB_NAME)
         with conn.cursor() as cursor:
             cursor.execute("SELECT COUNT(*) AS total FROM auctions")
             total = cursor.fetchone()['total']
             
-        conn.close()
         return True, total
     except Exception as e:
         return False, str(e)
+    finally:
+        if conn:
+            conn.close()
 
         
 def get_auctions(page=1, items_per_page=20):
 
+    conn = None
     try:
         conn = get_connection(DB_NAME)
         with conn.cursor() as cursor:
@@ -283,8 +548,6 @@ def get_auctions(page=1, items_per_page=20):
             )
             auctions = cursor.fetchall()
 
-        conn.close()
-
         return True, {
             "auctions": auctions,
             "total_auctions": total,
@@ -294,7 +557,137 @@ def get_auctions(page=1, items_per_page=20):
         }
     except Exception as e:
         return False, str(e)
+    finally:
+        if conn:
+            conn.close()
+
+
+# Exact COUNT(*) results per filter set, reused for AUCTION_COUNT_TTL seconds
+AUCTION_COUNT_TTL = int(os.getenv("AUCTION_COUNT_TTL", "60"))
+auction_count_cache = {}
+
+def build_auction_filters(auction_type=None, auction_status=None, date_from=None,
+                          date_to=None, search=None, county=None):
+    """Return the WHERE clause (starting with ' AND', or empty) and its params for the auctions filters."""
+    where = ""
+    params = []
+
+    if auction_type:
+        where += " AND AuctionType=%s"
+        params.append(auction_type)
+
+    if auction_status:
+        where += " AND AuctionStatus=%s"
+        params.append(auction_status)
+
+    if county:
+        where += " AND County=%s"
+        params.append(county)
+
+    if date_from:
+        where += " AND AuctionDateTime >= %s"
+        params.append(date_from)
+
+    if date_to:
+        where += " AND AuctionDateTime < DATE_ADD(%s, INTERVAL 1 DAY)"
+        params.append(date_to)
+
+    if search and search.strip():
+        search_where, search_params = build_search_filter(search)
+        where += search_where
+        params.extend(search_params)
+
+    return where, params
+
+def count_auctions(cursor, where, params, estimate=False):
+    """
+    Total rows for a filter set.
+    Unfiltered totals with estimate=True come from the table statistics (no scan);
+    everything else is an exact COUNT(*) cached for AUCTION_COUNT_TTL seconds.
+    Returns: (total, is_estimate)
+    """
+    if estimate and not where:
+        cursor.execute("""
+            SELECT TABLE_ROWS AS total FROM information_schema.TABLES
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'auctions'
+        """)
+        row = cursor.fetchone()
+        if row and row["total"] is not None:
+            return int(row["total"]), True
+
+    key = (where, tuple(params))
+    cached = auction_count_cache.get(key)
+    if cached and time.time() - cached[1] < AUCTION_COUNT_TTL:
+        return cached[0], False
 
+    cursor.execute("SELECT COUNT(*) AS total FROM auctions WHERE 1=1" + where, tuple(params))
+    total = cursor.fetchone()["total"]
+    if len(auction_count_cache) > 500:
+        auction_count_cache.clear()
+    auction_count_cache[key] = (total, time.time())
+    return total, False
+
+def benchmark_search(rows=1_000_000, terms=None, batch_size=5000):
+    """
+    Time the old LIKE '%term%' search against build_search_filter() on a synthetic
+    auctions_search_bench table with `rows` rows. The table is dropped afterwards.
+    Returns: {term: {"like": seconds, "indexed": seconds, "matches": n}}
+    """
+    import random
+    terms = terms or ["1234 main", "oak st", "06-2023-CA", "5142", "494102"]
+    streets = ["MAIN ST", "OAK AVE", "PINE RD", "LAS OLAS BLVD", "OCEAN DR", "SUNRISE BLVD", "UNIVERSITY DR"]
+    cities = ["FORT LAUDERDALE", "HOLLYWOOD", "PEMBROKE PINES", "CORAL SPRINGS", "MIAMI", "WESTON"]
+    results = {}
+    conn = get_connection(DB_NAME)
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("DROP TABLE IF EXISTS auctions_search_bench")
+            cursor.execute("CREATE TABLE auctions_search_bench LIKE auctions")
+            cursor.execute("ALTER TABLE auctions_search_bench DROP INDEX ft_auctions_address")
+            insert = """
+                INSERT INTO auctions_search_bench (PropertyAddress, CaseNo, ParcelID, CaseNoKey, ParcelKey, Link)
+                VALUES (%s, %s, %s, %s, %s, %s)
+            """
+            for start in range(0, rows, batch_size):
+                batch = []
+                for i in range(start, min(start + batch_size, rows)):
+                    address = f"{random.randint(1, 99999)} {random.choice(streets)}, {random.choice(cities)}, FL {random.randint(33000, 33399)}"
+                    case_no = f"{random.choice(['06', '13', '50'])}-{random.randint(2015, 2025)}-CA-{i:06d}"
+                    parcel = f"{random.randint(4941, 5142)}{random.randint(10, 99)}{i:08d}"
+                    batch.append((address, case_no, parcel, search_key(case_no), search_key(parcel), f"bench://{i}"))
+                cursor.executemany(insert, batch)
+                conn.commit()
+            cursor.execute("ALTER TABLE auctions_search_bench ADD FULLTEXT INDEX ft_auctions_address (PropertyAddress)")
+
+            for term in terms:
+                started = time.perf_counter()
+                cursor.execute(
+                    "SELECT COUNT(*) AS total FROM auctions_search_bench "
+                    "WHERE PropertyAddress LIKE %s OR CaseNo LIKE %s OR ParcelID LIKE %s",
+                    (f"%{term}%",) * 3
+                )
+                cursor.fetchone()
+                like_seconds = time.perf_counter() - started
+
+                where, params = build_search_filter(term)
+                started = time.perf_counter()
+                cursor.execute(
+                    "SELECT COUNT(*) AS total FROM auctions_search_bench WHERE 1=1"
+                    + where.replace("FROM auctions ", "FROM auctions_search_bench "),
+                    tuple(params)
+                )
+                matches = cursor.fetchone()["total"]
+                results[term] = {
+                    "like": round(like_seconds, 4),
+                    "indexed": round(time.perf_counter() - started, 4),
+                    "matches": matches,
+                }
+                print(f"[search benchmark] {term!r}: {results[term]}")
+            cursor.execute("DROP TABLE IF EXISTS auctions_search_bench")
+        conn.commit()
+    finally:
+        conn.close()
+    return results
 
 def get_filtered_auctions(
     page=1,
@@ -303,62 +696,31 @@ def get_filtered_auctions(
     auction_status=None,
     date_from=None,
     date_to=None,
-    search=None
+    search=None,
+    county=None
 ):
     """
     Fetch auctions with filters and search, supporting pagination or full data.
     Filters:
         - auction_type: filter by type
         - auction_status: filter by status
+        - county: filter by county (e.g. broward)
         - date_from / date_to: auction_date range
         - search: matches property_address, case_number, parcel_id
+    Deep pages still pay for OFFSET; use get_auctions_page() for cursor pagination.
     Returns: (success, data)
     """
+    conn = None
     try:
         conn = get_connection(DB_NAME)
         with conn.cursor() as cursor:
-            # Base query
-            query = "SELECT * FROM auctions WHERE 1=1"
-            count_query = "SELECT COUNT(*) AS total FROM auctions WHERE 1=1"
-            params = []
-            count_params = []
-
-            # Filters
-            if auction_type:
-                query += " AND AuctionType=%s"
-                count_query += " AND AuctionType=%s"
-                params.append(auction_type)
-                count_params.append(auction_type)
-
-            if auction_status:
-                query += " AND AuctionStatus=%s"
-                count_query += " AND AuctionStatus=%s"
-                params.append(auction_status)
-                count_params.append(auction_status)
-
-            if date_from:
-                query += " AND STR_TO_DATE(SUBSTRING_INDEX(AuctionDate, ' ', 1), '%%m/%%d/%%Y') >= %s"
-                count_query += " AND STR_TO_DATE(SUBSTRING_INDEX(AuctionDate, ' ', 1), '%%m/%%d/%%Y') >= %s"
-                params.append(date_from)
-                count_params.append(date_from)
-
-            if date_to:
-                query += " AND STR_TO_DATE(SUBSTRING_INDEX(AuctionDate, ' ', 1), '%%m/%%d/%%Y') <= %s"
-                count_query += " AND STR_TO_DATE(SUBSTRING_INDEX(AuctionDate, ' ', 1), '%%m/%%d/%%Y') <= %s"
-                params.append(date_to)
-                count_params.append(date_to)
-
-            # Search
-            if search:
-                query += " AND (PropertyAddress LIKE %s OR CaseNo LIKE %s OR ParcelID LIKE %s)"
-                count_query += " AND (PropertyAddress LIKE %s OR CaseNo LIKE %s OR ParcelID LIKE %s)"
-                search_param = f"%{search}%"
-                params.extend([search_param]*3)
-                count_params.extend([search_param]*3)
+            where, params = build_auction_filters(
+                auction_type, auction_status, date_from, date_to, search, county
+            )
+            query = "SELECT * FROM auctions WHERE 1=1" + where
 
             # Get total count
-            cursor.execute(count_query, tuple(count_params))
-            total = cursor.fetchone()['total']
+            total, _ = count_auctions(cursor, where, params)
 
             # Skip pagination if page or items_per_page is None
             if page is None or items_per_page is None:
@@ -383,7 +745,6 @@ def get_filtered_auctions(
             cursor.execute(query, tuple(params))
             auctions = cursor.fetchall()
 
-        conn.close()
         return True, {
             "auctions": auctions,
             "total_auctions": total,
@@ -392,7 +753,220 @@ def get_filtered_auctions(
             "items_per_page": items_per_page
         }
     except Exception as e:
-        return False, str(e)       
+        return False, str(e)
+    finally:
+        if conn:
+            conn.close()
+
+# Columns of the auctions download, in order. Internal keys (AID, CaseNoKey,
+# ParcelKey, GridHash) and the parsed AuctionDateTime stay out of exports.
+EXPORT_COLUMNS = [
+    "id", "PropertyAddress", "AuctionType", "CaseNo", "FinalJudgementAmount",
+    "ParcelID", "AuctionDate", "AuctionSoldAmount", "SoldTo", "PlaintiffMaxBid",
+    "AuctionStatus", "Link", "County",
+]
+
+def iter_filtered_auctions(auction_type=None, auction_status=None, date_from=None, date_to=None,
+                           search=None, county=None, chunk_size=1000):
+    """
+    Yield the EXPORT_COLUMNS of every auction matching the filters (newest first) without loading them all:
+    rows come from an unbuffered server-side cursor, chunk_size at a time.
+    The connection goes back to the pool when the generator is exhausted or closed.
+    """
+    where, params = build_auction_filters(
+        auction_type, auction_status, date_from, date_to, search, county
+    )
+    conn = get_connection(DB_NAME)
+    cursor = None
+    try:
+        cursor = conn.cursor(pymysql.cursors.SSDictCursor)
+        cursor.execute(
+            f"SELECT {', '.join(EXPORT_COLUMNS)} FROM auctions WHERE 1=1" + where + " ORDER BY id DESC",
+            tuple(params),
+        )
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            yield from rows
+    finally:
+        if cursor is not None:
+            cursor.close()  # drains what's left of the unbuffered result
+        conn.close()
+
+def get_auctions_page(
+    after_id=None,
+    before_id=None,
+    items_per_page=20,
+    auction_type=None,
+    auction_status=None,
+    date_from=None,
+    date_to=None,
+    search=None,
+    county=None,
+    with_total=False
+):
+    """
+    Keyset (cursor) pagination over auctions, newest first.
+        - after_id: return the page that follows the row with this id (older rows)
+        - before_id: return the page that precedes the row with this id (newer rows)
+        - neither: first page
+    Each page is an index range scan on the primary key, so page 5000 costs the same as page 1.
+    The total is only computed when with_total is set (estimated when unfiltered, else cached).
+    Returns: (success, data) with next_cursor / prev_cursor ids for the neighbouring pages.
+    """
+    try:
+        conn = get_connection(DB_NAME)
+        try:
+            with conn.cursor() as cursor:
+                where, params = build_auction_filters(
+                    auction_type, auction_status, date_from, date_to, search, county
+                )
+                query = "SELECT * FROM auctions WHERE 1=1" + where
+                page_params = list(params)
+
+                if before_id is not None:
+                    query += " AND id > %s ORDER BY id ASC LIMIT %s"
+                    page_params.extend([before_id, items_per_page + 1])
+                elif after_id is not None:
+                    query += " AND id < %s ORDER BY id DESC LIMIT %s"
+                    page_params.extend([after_id, items_per_page + 1])
+                else:
+                    query += " ORDER BY id DESC LIMIT %s"
+                    page_params.append(items_per_page + 1)
+
+                cursor.execute(query, tuple(page_params))
+                auctions = list(cursor.fetchall())
+
+                # One extra row tells us whether another page exists in the scan direction
+                more = len(auctions) > items_per_page
+                auctions = auctions[:items_per_page]
+                if before_id is not None:
+                    auctions.reverse()
+                    has_next, has_prev = True, more
+                else:
+                    has_next, has_prev = more, after_id is not None
+
+                data = {
+                    "auctions": auctions,
+                    "items_per_page": items_per_page,
+                    "next_cursor": auctions[-1]["id"] if auctions and has_next else None,
+                    "prev_cursor": auctions[0]["id"] if auctions and has_prev else None,
+                }
+                if with_total:
+                    total, is_estimate = count_auctions(cursor, where, params, estimate=True)
+                    data["total_auctions"] = total
+                    data["total_is_estimate"] = is_estimate
+                return True, data
+        finally:
+            conn.close()
+    except Exception as e:
+        return False, str(e)
+
+
+def get_auction_counts(auction_type=None, auction_status=None, date_from=None,
+                       date_to=None, search=None, county=None, detail=False):
+    """
+    Auctions per day for the calendar, keyed 'MM/DD/YYYY'.
+    Served from auction_daily_rollup (one range scan on its primary key); a text
+    search can't be answered from the rollup, so it groups the matching auctions instead.
+    detail=True returns {"count", "total_judgment", "total_sold"} per day instead of the count.
+    Returns: (success, data)
+    """
+    conn = None
+    try:
+        conn = get_connection(DB_NAME)
+        with conn.cursor() as cursor:
+            if search and search.strip():
+                where, params = build_auction_filters(
+                    auction_type, auction_status, date_from, date_to, search, county
+                )
+                cursor.execute(f"""
+                    SELECT DATE(AuctionDateTime) AS day, COUNT(*) AS count,
+                           SUM(FinalJudgementAmount) AS total_judgment, SUM(AuctionSoldAmount) AS total_sold
+                    FROM auctions
+                    WHERE AuctionDateTime IS NOT NULL{where}
+                    GROUP BY DATE(AuctionDateTime)
+                """, tuple(params))
+            else:
+                query = """
+                    SELECT AuctionDay AS day, SUM(auction_count) AS count,
+                           SUM(total_judgment) AS total_judgment, SUM(total_sold) AS total_sold
+                    FROM auction_daily_rollup
+                    WHERE 1=1
+                """
+                params = []
+                if date_from:
+                    query += " AND AuctionDay >= %s"
+                    params.append(date_from)
+                if date_to:
+                    query += " AND AuctionDay <= %s"
+                    params.append(date_to)
+                if auction_type:
+                    query += " AND AuctionType = %s"
+                    params.append(auction_type)
+                if auction_status:
+                    query += " AND AuctionStatus = %s"
+                    params.append(auction_status)
+                if county:
+                    query += " AND County = %s"
+                    params.append(county)
+                query += " GROUP BY AuctionDay"
+                cursor.execute(query, tuple(params))
+
+            counts = {}
+            for row in cursor.fetchall():
+                key = row["day"].strftime("%m/%d/%Y")
+                if detail:
+                    counts[key] = {
+                        "count": int(row["count"]),
+                        "total_judgment": row["total_judgment"],
+                        "total_sold": row["total_sold"],
+                    }
+                else:
+                    counts[key] = int(row["count"])
+        return True, counts
+    except Exception as e:
+        return False, str(e)
+    finally:
+        if conn:
+            conn.close()
+
+def get_auctions_by_date(date, county=None):
+    """
+    All auctions on one day ('MM/DD/YYYY' as used by the calendar, or 'YYYY-MM-DD').
+    Returns: (success, auctions)
+    """
+    day = None
+    for date_format in ("%m/%d/%Y", "%Y-%m-%d"):
+        try:
+            day = datetime.strptime(date, date_format).date()
+            break
+        except (TypeError, ValueError):
+            continue
+    if day is None:
+        return False, "Invalid date, expected MM/DD/YYYY"
+
+    conn = None
+    try:
+        conn = get_connection(DB_NAME)
+        with conn.cursor() as cursor:
+            query = """
+                SELECT * FROM auctions
+                WHERE AuctionDateTime >= %s AND AuctionDateTime < %s + INTERVAL 1 DAY
+            """
+            params = [day, day]
+            if county:
+                query += " AND County = %s"
+                params.append(county)
+            query += " ORDER BY AuctionDateTime, id"
+            cursor.execute(query, tuple(params))
+            return True, cursor.fetchall()
+    except Exception as e:
+        return False, str(e)
+    finally:
+        if conn:
+            conn.close()
 
 def get_all_auction_status():
     conn = get_connection(DB_NAME)
@@ -408,6 +982,33 @@ def get_all_auction_status():
     finally:
         conn.close()
 
+def revoke_token(token_hash, expires_at):
+    """Persist a logged-out token (by sha256) until its exp timestamp."""
+    conn = get_connection(DB_NAME)
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("""
+                INSERT INTO revoked_tokens (token_hash, expires_at)
+                VALUES (%s, FROM_UNIXTIME(%s))
+                ON DUPLICATE KEY UPDATE expires_at = VALUES(expires_at)
+            """, (token_hash, int(expires_at)))
+        conn.commit()
+    finally:
+        conn.close()
+
+def get_revoked_tokens():
+    """Unexpired revoked token hashes -> exp timestamp; expired ones are purged."""
+    conn = get_connection(DB_NAME)
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("DELETE FROM revoked_tokens WHERE expires_at < NOW()")
+            cursor.execute("SELECT token_hash, UNIX_TIMESTAMP(expires_at) AS expires_at FROM revoked_tokens")
+            revoked = {row["token_hash"]: float(row["expires_at"]) for row in cursor.fetchall()}
+        conn.commit()
+        return revoked
+    finally:
+        conn.close()
+
 # scraper database
 def update_scraper_log(last_run_time, auctions_inserted, status, error_message):
     conn = get_connection(DB_NAME)
@@ -425,6 +1026,41 @@ def update_scraper_log(last_run_time, auctions_inserted, status, error_message):
     finally:
         conn.close()
         
+def acquire_scraper_lock():
+    """
+    Claim the MySQL named lock 'scraper' so only one run happens across every
+    app process. Returns the connection holding it (keep it open for the whole
+    run, then pass it to release_scraper_lock()), or None if another process
+    holds it. The connection is not pooled: the pool reclaims connections held
+    longer than DB_POOL_LEAK_TIMEOUT, and closing it would drop the lock.
+    """
+    conn = pymysql.connect(
+        host=DB_HOST,
+        user=DB_USER,
+        password=DB_PASSWORD,
+        database=DB_NAME,
+        cursorclass=pymysql.cursors.DictCursor,
+        charset='utf8mb4'
+    )
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT GET_LOCK('scraper', 0) AS acquired")
+            if cursor.fetchone()["acquired"] == 1:
+                return conn
+    except Exception:
+        conn.close()
+        raise
+    conn.close()
+    return None
+
+def release_scraper_lock(conn):
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT RELEASE_LOCK('scraper')")
+    finally:
+        # The lock also goes away with the session, if the query failed
+        conn.close()
+
 def get_scraper_details():
     conn = get_connection(DB_NAME)
     try:
@@ -434,6 +1070,21 @@ def get_scraper_details():
     finally:
         conn.close()
 
+def get_scraper_progress():
+    """Progress of the most recent scraper checkpoint, or None if no run has started yet."""
+    conn = get_connection(DB_NAME)
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("""
+                SELECT run_key, date_from, date_to, status, total_links, done_links, started_at, updated_at
+                FROM scraper_checkpoints
+                ORDER BY updated_at DESC
+                LIMIT 1
+            """)
+            return cursor.fetchone()
+    finally:
+        conn.close()
+
 def update_scraper_schedule(next_run_time, daily_run_time):
     conn = get_connection(DB_NAME)
     try:
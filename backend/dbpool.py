@@ -0,0 +1,233 @@
+"""
+Thread-safe pool of pymysql connections, shared by the dashboard API
+(dbhandler) and the scraper (index.py).
+
+    pool = ConnectionPool(host=..., user=..., password=..., database=..., max_size=10)
+    conn = pool.connection()
+    try:
+        with conn.cursor() as cursor:
+            ...
+    finally:
+        conn.close()          # back to the pool, the socket stays open
+
+Connections are created lazily up to max_size, pinged when they have been
+idle for ping_after seconds, replaced after recycle seconds, and rolled back
+before reuse. A connection checked out for longer than leak_timeout seconds
+is reported with the stack that borrowed it.
+"""
+import threading
+import time
+import traceback
+from collections import deque
+
+import pymysql
+
+
+class PoolTimeout(Exception):
+    """No connection became free within the pool timeout."""
+
+
+class PooledConnection:
+    """
+    Proxy around a pooled pymysql connection. close() hands it back to the
+    pool; like a closed pymysql connection, ping(reconnect=True) borrows a new
+    one, so code written against plain pymysql keeps working.
+    """
+
+    def __init__(self, pool, raw):
+        self._pool = pool
+        self._raw = raw
+
+    @property
+    def open(self):
+        return self._raw is not None and self._raw.open
+
+    def ping(self, reconnect=True):
+        if self._raw is None:
+            if not reconnect:
+                raise pymysql.err.InterfaceError(0, "Connection was returned to the pool")
+            self._raw = self._pool._checkout(self)
+            return
+        self._raw.ping(reconnect=reconnect)
+
+    def close(self):
+        if self._raw is not None:
+            raw, self._raw = self._raw, None
+            self._pool._checkin(self, raw)
+
+    def __getattr__(self, name):
+        raw = self.__dict__.get("_raw")
+        if raw is None:
+            raise pymysql.err.InterfaceError(0, "Connection was returned to the pool")
+        return getattr(raw, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __del__(self):
+        # Garbage-collected without close(): count it as a leak but recover the slot
+        if self.__dict__.get("_raw") is not None:
+            self._pool._reclaim(self)
+
+
+class ConnectionPool:
+
+    def __init__(self, max_size=10, timeout=10, recycle=3600, ping_after=30, leak_timeout=120, **connect_kwargs):
+        self.max_size = max_size
+        self.timeout = timeout
+        self.recycle = recycle
+        self.ping_after = ping_after
+        self.leak_timeout = leak_timeout
+        connect_kwargs.setdefault("charset", "utf8mb4")
+        self.connect_kwargs = connect_kwargs
+
+        self._lock = threading.Condition()
+        self._idle = deque()      # (raw, created_at, last_used)
+        self._created = {}        # id(raw) -> created_at
+        self._in_use = {}         # id(proxy) -> (raw, checked_out_at, stack)
+        self._size = 0
+        self._closed = False
+        self.stats = {"created": 0, "reused": 0, "recycled": 0, "waits": 0, "timeouts": 0, "leaks": 0}
+
+    def connection(self):
+        """Borrow a connection; close() it (or use it as a context manager) to give it back."""
+        proxy = PooledConnection(self, None)
+        proxy._raw = self._checkout(proxy)
+        return proxy
+
+    def _checkout(self, proxy):
+        deadline = time.time() + self.timeout
+        with self._lock:
+            while True:
+                if self._idle:
+                    raw, created_at, last_used = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    self._size += 1
+                    raw = None
+                    break
+                self.stats["waits"] += 1
+                self.report_leaks()
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    self.stats["timeouts"] += 1
+                    raise PoolTimeout(f"No free MySQL connection after {self.timeout}s ({self.max_size} in use)")
+                self._lock.wait(remaining)
+
+        try:
+            if raw is not None:
+                raw = self._validate(raw, created_at, last_used)
+            if raw is None:
+                raw = self._connect()
+            else:
+                self.stats["reused"] += 1
+        except Exception:
+            with self._lock:
+                self._size -= 1
+                self._lock.notify()
+            raise
+
+        stack = traceback.format_stack(limit=8)[:-2] if self.leak_timeout else None
+        with self._lock:
+            self._in_use[id(proxy)] = (raw, time.time(), stack)
+        return raw
+
+    def _connect(self):
+        raw = pymysql.connect(**self.connect_kwargs)
+        self._created[id(raw)] = time.time()
+        self.stats["created"] += 1
+        return raw
+
+    def _discard(self, raw):
+        self._created.pop(id(raw), None)
+        try:
+            raw.close()
+        except Exception:
+            pass
+
+    def _validate(self, raw, created_at, last_used):
+        """Return a usable connection, or None if it had to be dropped."""
+        now = time.time()
+        if self.recycle and now - created_at > self.recycle:
+            self.stats["recycled"] += 1
+            self._discard(raw)
+            return None
+        if now - last_used > self.ping_after:
+            try:
+                raw.ping(reconnect=False)
+            except Exception:
+                self._discard(raw)
+                return None
+        return raw
+
+    def _checkin(self, proxy, raw):
+        with self._lock:
+            self._in_use.pop(id(proxy), None)
+        try:
+            # Drop whatever the borrower left uncommitted so the next one starts clean
+            raw.rollback()
+            keep = raw.open
+        except Exception:
+            keep = False
+        with self._lock:
+            if keep and not self._closed:
+                self._idle.append((raw, self._created.get(id(raw), time.time()), time.time()))
+            else:
+                self._discard(raw)
+                self._size -= 1
+            self._lock.notify()
+
+    def _reclaim(self, proxy):
+        with self._lock:
+            entry = self._in_use.pop(id(proxy), None)
+        if entry:
+            self.stats["leaks"] += 1
+            raw, checked_out_at, stack = entry
+            print(f"[DB pool] Connection garbage-collected without close() after {time.time() - checked_out_at:.1f}s")
+            if stack:
+                print("".join(stack))
+            with self._lock:
+                self._discard(raw)
+                self._size -= 1
+                self._lock.notify()
+
+    def report_leaks(self):
+        """Print every connection held longer than leak_timeout, with the stack that borrowed it."""
+        if not self.leak_timeout:
+            return []
+        now = time.time()
+        leaked = [entry for entry in list(self._in_use.values()) if now - entry[1] > self.leak_timeout]
+        for raw, checked_out_at, stack in leaked:
+            print(f"[DB pool] Connection checked out for {now - checked_out_at:.1f}s, possible leak:")
+            if stack:
+                print("".join(stack))
+        return leaked
+
+    def status(self):
+        with self._lock:
+            return {
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": len(self._in_use),
+                "max_size": self.max_size,
+                **self.stats,
+            }
+
+    def grow(self, max_size):
+        """Raise max_size to at least `max_size`; it is never lowered."""
+        with self._lock:
+            if max_size > self.max_size:
+                self.max_size = max_size
+                self._lock.notify_all()
+
+    def close_all(self):
+        """Close idle connections; checked-out ones are closed when they come back."""
+        with self._lock:
+            self._closed = True
+            while self._idle:
+                raw, _, _ = self._idle.pop()
+                self._discard(raw)
+                self._size -= 1
@@ -89,7 +89,7 @@ export default function ScraperDashboard() {
         toast.error(res.data?.message ?? "Failed to start scraper");
       }
     } catch (err) {
-      if(err.response.status===400){
+      if(err.response.status===400 || err.response.status===409){
         toast.error(err.response.data.message);
       }else{
         toast.error("Error starting scraper");
@@ -1,8 +1,19 @@
 import sys
-from datetime import datetime
+import os
+from datetime import datetime, timedelta
 from urllib.parse import quote_plus
 from dotenv import load_dotenv
 import pymysql
+# Import dbpool under the same name the dashboard (backend/dbhandler.py) uses,
+# so a process running both has one dbpool module, not dbpool and backend.dbpool
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend"))
+from dbpool import ConnectionPool
+from auction_parser import (
+    is_date, get_aid_from_url, parse_amount, parse_auction_datetime, search_key, auction_to_row,
+    parse_auction_stats, merge_detail_rows, parse_html, parse_auction_detail_html, has_auction_data,
+    auction_fragments_html,
+    grid_summary_hash, is_final_status, select_rows_to_fetch, grid_row_to_record, split_summary_rows,
+)
 import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 import re
@@ -11,62 +22,186 @@ import time
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import urlparse, parse_qs, urljoin
 import pandas as pd
+import tempfile
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
 import zipfile
 import os
 import zipfile
+import queue
+import threading
+import hashlib
+from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import requests
+from requests.adapters import HTTPAdapter
 import undetected_chromedriver as uc
 from seleniumwire.undetected_chromedriver import Chrome, ChromeOptions  # <- Selenium-Wire + UC
+from seleniumwire.utils import decode as decode_body
+
+# ============================================================
+# Progress events
+# ============================================================
+progress_listeners = []
+
+def add_progress_listener(listener):
+    """Register `listener(event)`; called with a dict like {"phase": "pagination", "county": ..., "pages": 3}."""
+    progress_listeners.append(listener)
+
+def remove_progress_listener(listener):
+    if listener in progress_listeners:
+        progress_listeners.remove(listener)
 
-BASE_URL = "https://broward.realforeclose.com/"
+def report_progress(phase, **details):
+    event = {"phase": phase, "time": time.time(), **details}
+    for listener in list(progress_listeners):
+        try:
+            listener(event)
+        except Exception as e:
+            print("Progress listener failed ", e)
+
+# County registry: name -> realforeclose site. Extra counties can be added
+# with SCRAPER_COUNTY_URLS="name=https://...,name2=https://..."
+COUNTIES = {
+    "broward": "https://broward.realforeclose.com/",
+    "miamidade": "https://www.miamidade.realforeclose.com/",
+    "palmbeach": "https://www.mypalmbeachclerk.realforeclose.com/",
+    "hillsborough": "https://www.hillsborough.realforeclose.com/",
+    "orange": "https://www.myorangeclerk.realforeclose.com/",
+    "duval": "https://duval.realforeclose.com/",
+    "lee": "https://www.lee.realforeclose.com/",
+}
+BASE_URL = COUNTIES["broward"]
+
+def get_counties():
+    counties = dict(COUNTIES)
+    for entry in (os.getenv("SCRAPER_COUNTY_URLS") or "").split(","):
+        if "=" in entry:
+            name, url = entry.split("=", 1)
+            counties[name.strip().lower()] = url.strip()
+    return counties
     
-def load_env():
+def load_env(county=None):
+    """
+    Load the scraper config for one county. County specific settings can be
+    overridden with a _<COUNTY> suffix, e.g. PLATFORM_USERNAME_MIAMIDADE or
+    SCRAPER_WORKERS_PALMBEACH (realforeclose accounts are per county).
+    """
     load_dotenv()
+    county = (county or os.getenv("SCRAPER_COUNTY") or "broward").lower()
+
+    def county_env(name, default=None):
+        return os.getenv(f"{name}_{county.upper()}") or os.getenv(name) or default
+
     return {
         "host": os.getenv("DB_HOST"),
         "user": os.getenv("DB_USER"),
         "password": os.getenv("DB_PASSWORD"),
         "database": os.getenv("DB_NAME"),
-        "platform_username":os.getenv("PLATFORM_USERNAME"),
-        "platform_password":os.getenv("PLATFORM_PASSWORD"),
+        "county": county,
+        "base_url": get_counties()[county],
+        "platform_username":county_env("PLATFORM_USERNAME"),
+        "platform_password":county_env("PLATFORM_PASSWORD"),
         "proxy_host":os.getenv("PROXY_HOST"),
         "proxy_port":os.getenv("PROXY_PORT"),
         "proxy_user":os.getenv("PROXY_USER"),
         "proxy_pass":os.getenv("PROXY_PASS"),
+        "proxy_budget":int(os.getenv(f"SCRAPER_PROXY_BUDGET_{county.upper()}") or 0),
+        "scraper_workers":int(county_env("SCRAPER_WORKERS", 1)),
+        "detail_retries":int(os.getenv("SCRAPER_DETAIL_RETRIES") or 2),
+        "http_fetch":os.getenv("SCRAPER_HTTP_FETCH", "1") == "1",
+        "incremental":os.getenv("SCRAPER_INCREMENTAL", "1") == "1",
+        "checkpoints":os.getenv("SCRAPER_CHECKPOINTS", "1") == "1",
+        "summary_mode":os.getenv("SCRAPER_SUMMARY_MODE", "0") == "1",
+        "network_capture":os.getenv("SCRAPER_NETWORK_CAPTURE", "0") == "1",
+        "block_resources":os.getenv("SCRAPER_BLOCK_RESOURCES", "1") == "1",
+        "capture_max_requests":int(os.getenv("SCRAPER_CAPTURE_MAX_REQUESTS") or 200),
+        "shard_days":int(os.getenv("SCRAPER_SHARD_DAYS") or 7),
+        "shard_workers":int(county_env("SCRAPER_SHARD_WORKERS", 1)),
     }
 
+# One pool per database, shared by every county run in this process
+db_pools = {}
+db_pools_lock = threading.Lock()
+# Each county run holds one connection for its whole scrape; run_all_counties() raises this
+db_pool_runs = {"concurrent": 1}
+
+def db_pool_size():
+    """SCRAPER_DB_POOL_SIZE, or one connection per concurrent county run plus a spare."""
+    return int(os.getenv("SCRAPER_DB_POOL_SIZE") or 0) or db_pool_runs["concurrent"] + 1
+
+def reserve_db_connections(concurrent_runs):
+    """Make the pools big enough for `concurrent_runs` county runs at once."""
+    with db_pools_lock:
+        db_pool_runs["concurrent"] = max(db_pool_runs["concurrent"], concurrent_runs)
+        for pool in db_pools.values():
+            pool.grow(db_pool_size())
+
+def get_db_pool(config):
+    key = (config["host"], config["user"], config["database"])
+    with db_pools_lock:
+        if key not in db_pools:
+            db_pools[key] = ConnectionPool(
+                host=config["host"],
+                user=config["user"],
+                password=config["password"],
+                database=config["database"],
+                charset='utf8mb4',
+                max_size=db_pool_size(),
+                # A run holds its connection for the whole scrape, so only report really long holds
+                leak_timeout=int(os.getenv("SCRAPER_DB_POOL_LEAK_TIMEOUT") or 6 * 3600)
+            )
+        return db_pools[key]
+
 def connect_db(config):
-    return pymysql.connect(
-        host=config["host"],
-        user=config["user"],
-        password=config["password"],
-        database=config["database"],
-        charset='utf8mb4'
+    """Borrow a pooled connection; close() returns it, ping(reconnect=True) borrows again."""
+    return get_db_pool(config).connection()
+
+
+AUCTION_COLUMNS = [
+    "PropertyAddress", "AuctionType", "CaseNo", "FinalJudgementAmount",
+    "ParcelID", "AuctionDate", "AuctionDateTime", "AuctionSoldAmount", "SoldTo",
+    "PlaintiffMaxBid", "AuctionStatus", "Link", "AID", "CaseNoKey", "ParcelKey",
+    "GridHash", "County"
+]
+# Typed columns get NULL (never '') for missing values
+TYPED_COLUMNS = {"FinalJudgementAmount", "AuctionDateTime", "AuctionSoldAmount", "AID"}
+
+# Tables already created by this process, so CREATE TABLE runs once
+ready_tables = set()
+
+def add_column_if_missing(cursor, table_name, column, definition):
+    cursor.execute(
+        """
+        SELECT 1 FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s
+        """,
+        (table_name, column),
     )
+    if cursor.fetchone():
+        return False
+    cursor.execute(f"ALTER TABLE `{table_name}` ADD COLUMN {column} {definition}")
+    return True
+
+def add_index_if_missing(cursor, table_name, index_name, columns):
+    cursor.execute(
+        """
+        SELECT 1 FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s
+        """,
+        (table_name, index_name),
+    )
+    if not cursor.fetchone():
+        cursor.execute(f"ALTER TABLE `{table_name}` ADD INDEX {index_name} ({columns})")
 
-
-def save_auctions_to_db(data_list, connection, table_name="auctions"):
-    """
-    Save scraped auction data to MySQL database.
-
-    Parameters:
-        data_list (list): List of dictionaries containing auction data.
-        connection (pymysql.connections.Connection): Existing DB connection.
-        table_name (str): Table to save data into.
-    """
-    
-    
-    if not connection.open:  # <- check if connection is alive
-        connection.ping(reconnect=True)
-    
-    # Define table columns
-    columns = [
-        "PropertyAddress", "AuctionType", "CaseNo", "FinalJudgementAmount",
-        "ParcelID", "AuctionDate", "AuctionSoldAmount", "SoldTo",
-        "PlaintiffMaxBid", "AuctionStatus", "Link"
-    ]
-    
+def ensure_auctions_table(connection, table_name="auctions"):
+    """Create the auctions table (same schema as dbhandler) once per process."""
+    if table_name in ready_tables:
+        return
 
     # Create table if not exists
     create_table_sql = f"""
@@ -75,117 +210,523 @@ def save_auctions_to_db(data_list, connection, table_name="auctions"):
         PropertyAddress VARCHAR(255),
         AuctionType VARCHAR(255),
         CaseNo VARCHAR(255),
-        FinalJudgementAmount VARCHAR(255),
+        FinalJudgementAmount DECIMAL(14,2) NULL,
         ParcelID VARCHAR(255),
         AuctionDate VARCHAR(100),
-        AuctionSoldAmount VARCHAR(100),
+        AuctionDateTime DATETIME NULL,
+        AuctionSoldAmount DECIMAL(14,2) NULL,
         SoldTo VARCHAR(255),
         PlaintiffMaxBid VARCHAR(255),
         AuctionStatus VARCHAR(100),
-        Link TEXT
-    )
+        Link VARCHAR(2083) UNIQUE,
+        AID BIGINT NULL,
+        CaseNoKey VARCHAR(64),
+        ParcelKey VARCHAR(64),
+        GridHash CHAR(40),
+        County VARCHAR(50),
+        INDEX idx_auctions_county (County),
+        INDEX idx_auctions_aid (AID),
+        INDEX idx_auctions_datetime (AuctionDateTime),
+        INDEX idx_auctions_status_date (AuctionStatus, AuctionDateTime),
+        INDEX idx_auctions_type_date (AuctionType, AuctionDateTime),
+        INDEX idx_auctions_caseno_key (CaseNoKey),
+        INDEX idx_auctions_parcel_key (ParcelKey),
+        FULLTEXT INDEX ft_auctions_address (PropertyAddress)
+    ) CHARACTER SET utf8mb4
     """
-    
+    with connection.cursor() as cursor:
+        cursor.execute(create_table_sql)
+        add_column_if_missing(cursor, table_name, "GridHash", "CHAR(40)")
+        if add_column_if_missing(cursor, table_name, "County", "VARCHAR(50)"):
+            # Everything scraped before counties existed came from Broward
+            cursor.execute(f"UPDATE `{table_name}` SET County = 'broward' WHERE County IS NULL")
+        add_index_if_missing(cursor, table_name, "idx_auctions_county", "County")
+        # Typed columns; converting existing data is done by dbhandler.migrate_auctions_schema()
+        add_column_if_missing(cursor, table_name, "AuctionDateTime", "DATETIME NULL")
+        add_column_if_missing(cursor, table_name, "AID", "BIGINT NULL")
+        add_column_if_missing(cursor, table_name, "CaseNoKey", "VARCHAR(64)")
+        add_column_if_missing(cursor, table_name, "ParcelKey", "VARCHAR(64)")
+        add_index_if_missing(cursor, table_name, "idx_auctions_datetime", "AuctionDateTime")
+    connection.commit()
+    ready_tables.add(table_name)
+
+def ensure_rollup_table(connection):
+    """Per day x county x status x type totals behind the calendar endpoints (same schema as dbhandler)."""
+    if "auction_daily_rollup" in ready_tables:
+        return
+    with connection.cursor() as cursor:
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS auction_daily_rollup (
+                AuctionDay DATE NOT NULL,
+                County VARCHAR(50) NOT NULL DEFAULT '',
+                AuctionStatus VARCHAR(100) NOT NULL DEFAULT '',
+                AuctionType VARCHAR(255) NOT NULL DEFAULT '',
+                auction_count INT NOT NULL DEFAULT 0,
+                total_judgment DECIMAL(16,2) NULL,
+                total_sold DECIMAL(16,2) NULL,
+                PRIMARY KEY (AuctionDay, County, AuctionStatus, AuctionType)
+            ) CHARACTER SET utf8mb4
+        """)
+    connection.commit()
+    ready_tables.add("auction_daily_rollup")
+
+def refresh_daily_rollup(cursor, day_counties):
+    """
+    Recompute the rollup rows of the given (auction day, county) pairs from the auctions table.
+    Scoped to the county, so a batch never rewrites the rows of a county another run is saving.
+    """
+    for day, county in sorted(day_counties):
+        cursor.execute("DELETE FROM auction_daily_rollup WHERE AuctionDay = %s AND County = %s", (day, county))
+        cursor.execute("""
+            INSERT INTO auction_daily_rollup
+                (AuctionDay, County, AuctionStatus, AuctionType, auction_count, total_judgment, total_sold)
+            SELECT %s, %s, COALESCE(AuctionStatus, ''), COALESCE(AuctionType, ''),
+                   COUNT(*), SUM(FinalJudgementAmount), SUM(AuctionSoldAmount)
+            FROM auctions
+            WHERE AuctionDateTime >= %s AND AuctionDateTime < %s + INTERVAL 1 DAY
+              AND COALESCE(County, '') = %s
+            GROUP BY COALESCE(AuctionStatus, ''), COALESCE(AuctionType, '')
+        """, (day, county, day, day, county))
+
+def merge_auction_row(existing, row):
+    """Blank scraped values keep what's already stored (mirrors the upsert SQL)."""
+    return {
+        column: row[column] if row[column] not in ("", None) else existing.get(column)
+        for column in AUCTION_COLUMNS
+    }
+
+def save_auctions_to_db(data_list, connection, table_name="auctions", batch_size=None):
+    """
+    Save scraped auction data to MySQL database.
+
+    Rows are upserted by Link in batches of `batch_size` with one
+    multi-row INSERT ... ON DUPLICATE KEY UPDATE and a commit per batch,
+    so re-scraped auctions get their new status/amount instead of failing
+    on the UNIQUE Link. Blank scraped values never overwrite stored ones.
+    For the auctions table, the daily rollup of every day and county a batch touched
+    is recomputed in the same transaction.
+
+    Parameters:
+        data_list (list): List of dictionaries containing auction data.
+        connection (pymysql.connections.Connection): Existing DB connection.
+        table_name (str): Table to save data into.
+        batch_size (int): Rows per batch (default: SCRAPER_DB_BATCH_SIZE or 500).
+
+    Returns:
+        dict: inserted / updated / unchanged / failed counts.
+    """
+    if not connection.open:  # <- check if connection is alive
+        connection.ping(reconnect=True)
+
+    batch_size = batch_size or int(os.getenv("SCRAPER_DB_BATCH_SIZE") or 500)
+    counts = {"inserted": 0, "updated": 0, "unchanged": 0, "failed": 0}
+
     try:
-        with connection.cursor() as cursor:
-            cursor.execute(create_table_sql)
-        connection.commit()
+        ensure_auctions_table(connection, table_name)
+        if table_name == "auctions":
+            ensure_rollup_table(connection)
     except Exception as e:
         print("Error creating table:", e)
-    
 
-    # Insert data
-    insert_sql = f"""
-    INSERT INTO `{table_name}` (
-        PropertyAddress, AuctionType, CaseNo, FinalJudgementAmount,
-        ParcelID, AuctionDate, AuctionSoldAmount, SoldTo,
-        PlaintiffMaxBid, AuctionStatus, Link
-    ) VALUES (
-        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+    column_list = ", ".join(AUCTION_COLUMNS)
+    placeholders = ", ".join(["%s"] * len(AUCTION_COLUMNS))
+    updates = ", ".join(
+        f"{column} = COALESCE(VALUES({column}), {column})"
+        if column in TYPED_COLUMNS else
+        f"{column} = COALESCE(NULLIF(VALUES({column}), ''), {column})"
+        for column in AUCTION_COLUMNS if column != "Link"
     )
+    upsert_sql = f"""
+    INSERT INTO `{table_name}` ({column_list})
+    VALUES ({placeholders})
+    ON DUPLICATE KEY UPDATE {updates}
     """
-    
 
-    inserted_count = 0
+    # Last occurrence of a link wins, rows without a link can't be upserted
+    rows_by_link = {}
     for data in data_list:
-        auction_status_info = data.get("auction_status", {})
-        details = data.get("details", {})
-        
-
-        def get_detail(key):
-            return details.get(key, "") or ""
+        row = auction_to_row(data)
+        if not row["Link"]:
+            print("Skipping auction without link ", row)
+            counts["failed"] += 1
+            continue
+        rows_by_link[row["Link"]] = row
+    rows = list(rows_by_link.values())
 
-        
-        # Auction status & date logic
-        status = auction_status_info.get("status") or auction_status_info.get("Auction Starts") or ""
-        date = auction_status_info.get("date") or auction_status_info.get("Auction Starts") or ""
-        
-        if not is_date(date):
-            date = ""
-        if status.lower() == "auction starts":
-            auction_date = date
-            auction_status = "Auction Starts"
-        else:
-            auction_date = date or ""
-            auction_status = status or ""
-        
+    for start in range(0, len(rows), batch_size):
+        batch = rows[start:start + batch_size]
+        links = [row["Link"] for row in batch]
+        try:
+            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+                cursor.execute(
+                    f"SELECT {column_list} FROM `{table_name}` WHERE Link IN ({', '.join(['%s'] * len(links))})",
+                    links,
+                )
+                existing = {item["Link"]: item for item in cursor.fetchall()}
+
+                to_write = []
+                day_counties = set()
+                inserted = updated = unchanged = 0
+                for row in batch:
+                    old = existing.get(row["Link"])
+                    if old is None:
+                        inserted += 1
+                        county = row["County"] or ""
+                    elif merge_auction_row(old, row) == {c: old.get(c) for c in AUCTION_COLUMNS}:
+                        unchanged += 1
+                        continue
+                    else:
+                        updated += 1
+                        # A blank County keeps the stored one (see the upsert)
+                        county = row["County"] or old.get("County") or ""
+                        if old.get("AuctionDateTime"):
+                            day_counties.add((old["AuctionDateTime"].date(), old.get("County") or ""))
+                    if row["AuctionDateTime"]:
+                        day_counties.add((row["AuctionDateTime"].date(), county))
+                    to_write.append(tuple(row[c] for c in AUCTION_COLUMNS))
+
+                if to_write:
+                    cursor.executemany(upsert_sql, to_write)
+                if day_counties and table_name == "auctions":
+                    refresh_daily_rollup(cursor, day_counties)
+            connection.commit()
+            counts["inserted"] += inserted
+            counts["updated"] += updated
+            counts["unchanged"] += unchanged
+        except Exception as e:
+            connection.rollback()
+            counts["failed"] += len(batch)
+            print(f"Error saving batch of {len(batch)} auctions: {e}")
 
-        amount = auction_status_info.get("amount", "")
-        if auction_status.lower() != "auction sold":
-            amount = ""
+    print(f"Saved {len(data_list)} records into `{table_name}`: "
+          f"{counts['inserted']} inserted, {counts['updated']} updated, "
+          f"{counts['unchanged']} unchanged, {counts['failed']} failed")
+    return counts
 
-        
-        # Clean final judgment amount
-        final_judgment_amount = get_detail("Final Judgment Amount").replace("$", "").replace(",", "").strip()
-        
+# ============================================================
+# Excel export (backend/auctions.xlsx)
+# ============================================================
+EXCEL_PATH = os.getenv("SCRAPER_EXCEL_PATH") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "backend", "auctions.xlsx"
+)
+# Sheet header -> auctions column, in the workbook's column order
+EXCEL_COLUMNS = [
+    ("Property Address", "PropertyAddress"),
+    ("Auction Type", "AuctionType"),
+    ("Case no", "CaseNo"),
+    ("Final Judgement Amount", "FinalJudgementAmount"),
+    ("Parcel ID #", "ParcelID"),
+    ("Auction Date", "AuctionDate"),
+    ("Auction Sold Amount", "AuctionSoldAmount"),
+    ("Sold To", "SoldTo"),
+    ("Plaintiff Max Bid", "PlaintiffMaxBid"),
+    ("Auction Status", "AuctionStatus"),
+    ("Link", "Link"),
+]
+# County writers run in parallel but share the one workbook
+excel_lock = threading.Lock()
+
+def excel_value(value):
+    if isinstance(value, Decimal):
+        return float(value)
+    return "" if value is None else value
+
+def read_excel_rows(path, cache=None):
+    """
+    Existing data rows keyed by Link (rows without a link keep a positional key), in sheet order.
+    `cache` is the caller's {path: (mtime_ns, size, rows)} of its last export, used while the file is unchanged.
+    """
+    rows = {}
+    if not os.path.exists(path):
+        return rows
+    stat = os.stat(path)
+    cached = (cache or {}).get(path)
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return dict(cached[2])
+    workbook = load_workbook(path, read_only=True)
+    try:
+        width = len(EXCEL_COLUMNS)
+        for index, values in enumerate(workbook.active.iter_rows(min_row=2, values_only=True)):
+            values = [("" if value is None else value) for value in values[:width]]
+            values += [""] * (width - len(values))
+            if not any(values):
+                continue
+            rows[values[-1] or f"#row{index}"] = values
+    finally:
+        workbook.close()
+    return rows
 
-        values = (
-            get_detail("Property Address"),
-            get_detail("Case Type"),
-            get_detail("Case Number"),
-            final_judgment_amount,
-            get_detail("Parcel ID"),
-            auction_date,
-            amount,
-            "",  # Sold To
-            "",  # Plaintiff Max Bid
-            auction_status,
-            auction_status_info.get("link")
-        )
-        
+def save_auctions_to_excel(data_list, path=None, cache=None):
+    """
+    Merge scraped auctions into the Excel export by Link: new links are appended,
+    changed ones updated in place, blank scraped values keep what the sheet has.
+
+    An .xlsx is a zip of XML parts, so it can't be appended to in place. Existing rows
+    are streamed in with a read-only workbook, and the result is written with a
+    write-only workbook to a temp file that replaces the original atomically.
+    Both modes stream rows. With a `cache` dict the rows of the last export are kept
+    in it (checked against the file's mtime/size), so repeated exports in one run only
+    pay for the write. The caller owns the cache and drops it when the run ends.
+
+    Returns:
+        dict: added / updated counts.
+    """
+    path = path or EXCEL_PATH
+    counts = {"added": 0, "updated": 0}
 
+    new_rows = {}
+    for data in data_list:
+        row = auction_to_row(data)
+        if row["Link"]:
+            new_rows[row["Link"]] = [excel_value(row[column]) for _, column in EXCEL_COLUMNS]
+    if not new_rows:
+        return counts
+
+    with excel_lock:
+        rows = read_excel_rows(path, cache)
+        for link, values in new_rows.items():
+            old = rows.get(link)
+            if old is None:
+                rows[link] = values
+                counts["added"] += 1
+                continue
+            merged = [new if new not in ("", None) else prev for new, prev in zip(values, old)]
+            if merged != old:
+                rows[link] = merged
+                counts["updated"] += 1
+        if not counts["added"] and not counts["updated"]:
+            return counts
+
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet("Sheet1")
+        header_font = Font(bold=True)
+        header = []
+        for title, _ in EXCEL_COLUMNS:
+            cell = WriteOnlyCell(sheet, value=title)
+            cell.font = header_font
+            header.append(cell)
+        sheet.append(header)
+        for values in rows.values():
+            sheet.append(values)
+
+        fd, temp_path = tempfile.mkstemp(suffix=".xlsx", dir=os.path.dirname(path) or ".")
+        os.close(fd)
         try:
-            with connection.cursor() as cursor:
-                cursor.execute(insert_sql, values)
-            inserted_count += 1
-        except Exception as e:
-            print(f"Error inserting row {values}: {e}")
-            continue
+            workbook.save(temp_path)
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        if cache is not None:
+            stat = os.stat(path)
+            cache[path] = (stat.st_mtime_ns, stat.st_size, rows)
 
-        
-    connection.commit()
-    print(f"Inserted {inserted_count} / {len(data_list)} records into `{table_name}`")
+    print(f"Excel export: {counts['added']} added, {counts['updated']} updated, {len(rows)} rows in {path}")
+    return counts
+
+CAPTURE_SCOPES = [r".*\.realforeclose\.com/.*"]
+
+# ============================================================
+# Resource filtering (proxy bandwidth)
+# ============================================================
+BLOCKED_EXTENSIONS = {
+    "image": (".png", ".jpg", ".jpeg", ".gif", ".webp", ".avif", ".svg", ".ico", ".bmp"),
+    "font": (".woff", ".woff2", ".ttf", ".otf", ".eot"),
+    "media": (".mp4", ".webm", ".mp3", ".wav", ".ogg"),
+}
+# Third-party hosts the site or its anti-bot checks need
+ALLOWED_HOSTS = (
+    "realforeclose.com",
+    "challenges.cloudflare.com",
+    "www.google.com",
+    "www.gstatic.com",
+    "hcaptcha.com",
+)
+# Rough size of a blocked response, only used for the "saved" estimate
+ESTIMATED_BYTES = {"image": 30000, "font": 40000, "media": 500000, "third-party": 20000}
+
+# county -> request/byte counters, so concurrent county runs don't reset each other's report
+RESOURCE_STATS = {}
+resource_stats_lock = threading.Lock()
+
+def new_resource_stats():
+    return {"allowed_requests": 0, "allowed_bytes": 0, "blocked_requests": 0, "blocked_bytes_estimate": 0, "blocked_by_kind": {}}
+
+def classify_blocked_request(url):
+    """Return why a request isn't needed ("image", "font", "media", "third-party") or None to allow it."""
+    parsed = urlparse(url)
+    host = parsed.hostname or ""
+    if not any(host == allowed or host.endswith("." + allowed) for allowed in ALLOWED_HOSTS):
+        return "third-party"
+    path = parsed.path.lower()
+    for kind, extensions in BLOCKED_EXTENSIONS.items():
+        if path.endswith(extensions):
+            return kind
+    return None
+
+def blocking_scopes():
+    """
+    selenium-wire scopes that route every request block_unneeded_resources()
+    would abort through the interceptor: hosts outside ALLOWED_HOSTS and
+    blocked file types on any host. Allowed third-party requests stay out of
+    scope, so they're neither intercepted nor stored.
+    """
+    hosts = "|".join(re.escape(host) for host in ALLOWED_HOSTS)
+    extensions = "|".join(re.escape(ext) for kind in BLOCKED_EXTENSIONS.values() for ext in kind)
+    return [
+        rf"(?i)^[a-z]+://(?!(?:[^/:?#]*\.)?(?:{hosts})(?:[:/?#]|$))",
+        rf"(?i)^[^?#]*(?:{extensions})(?:[?#]|$)",
+    ]
 
-def setup_driver(config):
+def block_unneeded_resources(request, county="broward"):
+    kind = classify_blocked_request(request.url)
+    if kind is None:
+        return
+    request.abort()
+    with resource_stats_lock:
+        stats = RESOURCE_STATS.setdefault(county, new_resource_stats())
+        stats["blocked_requests"] += 1
+        stats["blocked_bytes_estimate"] += ESTIMATED_BYTES[kind]
+        stats["blocked_by_kind"][kind] = stats["blocked_by_kind"].get(kind, 0) + 1
+
+def count_response_bytes(request, response, county="broward"):
+    with resource_stats_lock:
+        stats = RESOURCE_STATS.setdefault(county, new_resource_stats())
+        stats["allowed_requests"] += 1
+        stats["allowed_bytes"] += len(response.body or b"")
+
+def reset_resource_report(county="broward"):
+    with resource_stats_lock:
+        RESOURCE_STATS[county] = new_resource_stats()
+
+def resource_report(county="broward"):
+    """Print requests/bytes of this county's run that went through the proxy vs. blocked."""
+    with resource_stats_lock:
+        counters = RESOURCE_STATS.get(county) or new_resource_stats()
+        stats = dict(counters, blocked_by_kind=dict(counters["blocked_by_kind"]))
+    if stats["allowed_requests"] or stats["blocked_requests"]:
+        print(f"[Resources] {county}: {stats['allowed_requests']} requests / {stats['allowed_bytes'] / 1024:.0f} KB downloaded, "
+              f"{stats['blocked_requests']} blocked {stats['blocked_by_kind']} "
+              f"(~{stats['blocked_bytes_estimate'] / 1024:.0f} KB saved)")
+    return stats
+
+def get_proxy_urls(config):
     # ——— your proxy creds ———
     proxy_host = config["proxy_host"]
     proxy_port = config["proxy_port"]
     proxy_user = config["proxy_user"]
     proxy_pass = config["proxy_pass"]
     # ———————————————————————
+    return {
+        'http':  f'http://{proxy_user}:{proxy_pass}@{proxy_host}:{proxy_port}',
+        'https': f'http://{proxy_user}:{proxy_pass}@{proxy_host}:{proxy_port}',
+    }
 
+# Concurrent browsers per proxy budget key ("global" or a county name)
+proxy_slots = {}
+proxy_slots_lock = threading.Lock()
+
+def get_proxy_budgets(config):
+    """(key, budget) for the process-wide and the county budget, leaving out unlimited (0) ones."""
+    budgets = []
+    global_budget = int(os.getenv("SCRAPER_PROXY_BUDGET") or 0)
+    if global_budget:
+        budgets.append(("global", global_budget))
+    if config["proxy_budget"]:
+        budgets.append((config["county"], config["proxy_budget"]))
+    return budgets
+
+def limit_sessions(config, wanted):
+    """Cap a number of parallel child sessions (shards, detail workers) at the proxy budget."""
+    budgets = [budget for _, budget in get_proxy_budgets(config)]
+    if budgets and wanted > min(budgets):
+        print(f"[Proxy] Limiting {wanted} sessions to the proxy budget of {min(budgets)}")
+        return min(budgets)
+    return wanted
+
+def acquire_proxy_slots(config):
+    """
+    Block until this county (SCRAPER_PROXY_BUDGET_<COUNTY>) and the whole process
+    (SCRAPER_PROXY_BUDGET) are under their concurrent browser budget.
+    A budget of 0 means unlimited. Returns the acquired semaphores.
+    """
+    timeout = int(os.getenv("SCRAPER_PROXY_WAIT") or 1800)
+    acquired = []
+    for key, budget in get_proxy_budgets(config):
+        with proxy_slots_lock:
+            slot = proxy_slots.setdefault(key, threading.BoundedSemaphore(budget))
+        if not slot.acquire(timeout=timeout):
+            for held in acquired:
+                held.release()
+            raise TimeoutError(f"No free proxy slot for {key} after {timeout}s")
+        acquired.append(slot)
+    return acquired
+
+@contextmanager
+def proxy_slots_released(driver):
+    """
+    Lend an idle driver's proxy slots to the sessions it fans out to (shards,
+    detail workers) and take them back afterwards. Otherwise a budget at or
+    below the number of child sessions deadlocks: the children wait for a slot
+    their parent holds while the parent waits for the children.
+    """
+    slots = getattr(driver, "proxy_slots", None)
+    if slots is None:
+        yield
+        return
+    lent = list(slots)
+    slots.clear()
+    for slot in lent:
+        slot.release()
+    try:
+        yield
+    finally:
+        timeout = int(os.getenv("SCRAPER_PROXY_WAIT") or 1800)
+        for slot in lent:
+            if not slot.acquire(timeout=timeout):
+                raise TimeoutError(f"Could not take back the proxy slot after {timeout}s")
+            slots.append(slot)
+
+def setup_driver(config, profile_dir=None):
+    slots = acquire_proxy_slots(config)
+    try:
+        driver = create_driver(config, profile_dir)
+    except Exception:
+        for slot in slots:
+            slot.release()
+        raise
+
+    # Give the proxy slots back when the browser is closed
+    driver.proxy_slots = slots
+    quit_driver = driver.quit
+    def quit_and_release():
+        try:
+            quit_driver()
+        finally:
+            while slots:
+                slots.pop().release()
+    driver.quit = quit_and_release
+    return driver
+
+def create_driver(config, profile_dir=None):
     seleniumwire_options = {
         'proxy': {
-            'http':  f'http://{proxy_user}:{proxy_pass}@{proxy_host}:{proxy_port}',
-            'https': f'http://{proxy_user}:{proxy_pass}@{proxy_host}:{proxy_port}',
+            **get_proxy_urls(config),
             'no_proxy': 'localhost,127.0.0.1'
-        }
+        },
+        # Keep captured traffic in memory and bounded, long runs used to grow it forever
+        'request_storage': 'memory',
+        'request_storage_max_size': config["capture_max_requests"],
     }
 
     options = ChromeOptions()
     options.headless = False
     options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_argument(f"--user-data-dir={os.path.join(os.getcwd(), 'chrome-profile')}")
+    # Every concurrent Chrome needs its own profile dir, Chrome locks it while running
+    default_profile = "chrome-profile" if config["county"] == "broward" else f"chrome-profile-{config['county']}"
+    profile_dir = profile_dir or os.path.join(os.getcwd(), default_profile)
+    options.add_argument(f"--user-data-dir={profile_dir}")
     options.add_argument("--window-size=1920,1080")
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
@@ -194,7 +735,21 @@ def setup_driver(config):
     options.add_argument('--ignore-ssl-errors=yes')
 
 
+    if config["block_resources"]:
+        # Images never even get requested, the interceptor catches the rest
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+
     driver = Chrome(options=options, seleniumwire_options=seleniumwire_options)
+    # Only capture realforeclose traffic (pages + AJAX), not CDNs or analytics
+    driver.scopes = CAPTURE_SCOPES
+    driver.capture_traffic = config["network_capture"]
+    driver.county = config["county"]
+    if config["block_resources"]:
+        # Interceptors only see in-scope requests, so widen the scope by what gets blocked
+        driver.scopes = CAPTURE_SCOPES + blocking_scopes()
+        county = config["county"]
+        driver.request_interceptor = lambda request: block_unneeded_resources(request, county)
+        driver.response_interceptor = lambda request, response: count_response_bytes(request, response, county)
     return driver
     
 
@@ -227,22 +782,6 @@ def get_from_and_to(connection):
     finally:
         connection.close()
 
-def is_date(string, date_format="%m/%d/%Y %I:%M %p"):
-    # Remove timezone abbreviation (e.g., ' ET') if present
-    string = string.rsplit(' ', 1)[0] if string.endswith(" ET") else string
-    try:
-        datetime.strptime(string, date_format)
-        return True
-    except ValueError:
-        return False
-
-def get_aid_from_url(url):
-    try:
-        query_params = parse_qs(urlparse(url).query)
-        return query_params.get("AID", [None])[0]
-    except Exception as e:
-        print("Error occured in getting AID from url ", e)
-
 def is_valid_date(date_str, date_format="%m/%d/%Y %I:%M %p %Z"):
     try:
         datetime.strptime(date_str, date_format)
@@ -254,6 +793,9 @@ def format_to_mmddyyyy(date_str):
  
     if not date_str:
         return ""
+    # DATE columns from scraper_logs come back as date objects
+    if hasattr(date_str, "strftime"):
+        return date_str.strftime("%m/%d/%Y")
     try:
         # Try MM/DD/YYYY first
         datetime.strptime(date_str, "%m/%d/%Y")
@@ -267,10 +809,87 @@ def format_to_mmddyyyy(date_str):
             return ""  # Invalid format
 
 
+# ============================================================
+# Readiness waits (instead of fixed sleeps)
+# ============================================================
+# county -> [(label, waited, replaced_sleep)], kept apart so concurrent county runs don't reset each other's
+WAIT_TIMINGS = {}
+wait_timings_lock = threading.Lock()
+
+def wait_for_signal(driver, condition, label, replaced_sleep=0, timeout=20, poll=0.2):
+    """
+    Block until `condition(driver)` is truthy and return its value.
+    The time spent is recorded against the fixed sleep it replaces so
+    wait_report() can show how much idle time was saved.
+    """
+    start = time.perf_counter()
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=poll).until(condition)
+    finally:
+        county = getattr(driver, "county", None) or "broward"
+        with wait_timings_lock:
+            WAIT_TIMINGS.setdefault(county, []).append((label, time.perf_counter() - start, replaced_sleep))
+
+def reset_wait_report(county="broward"):
+    with wait_timings_lock:
+        WAIT_TIMINGS[county] = []
+
+def wait_report(county="broward"):
+    """Summarize a county's recorded waits per label and print the idle time saved vs. fixed sleeps."""
+    with wait_timings_lock:
+        timings = list(WAIT_TIMINGS.get(county, []))
+
+    report = {}
+    for label, waited, replaced in timings:
+        entry = report.setdefault(label, {"count": 0, "waited": 0.0, "fixed": 0.0})
+        entry["count"] += 1
+        entry["waited"] += waited
+        entry["fixed"] += replaced
+
+    total_waited = sum(e["waited"] for e in report.values())
+    total_fixed = sum(e["fixed"] for e in report.values())
+    for label, entry in report.items():
+        print(f"[Waits] {county} {label}: {entry['count']}x, waited {entry['waited']:.1f}s "
+              f"vs {entry['fixed']:.1f}s fixed, saved {entry['fixed'] - entry['waited']:.1f}s")
+    print(f"[Waits] {county} total waited {total_waited:.1f}s vs {total_fixed:.1f}s fixed, "
+          f"saved {total_fixed - total_waited:.1f}s")
+    return report
+
+def nav_says_welcome(driver):
+    navs = driver.find_elements(By.ID, "MAIN_TBL_NAV")
+    return bool(navs) and "Welcome" in navs[0].text
+
+def login_form_or_welcome(driver):
+    return nav_says_welcome(driver) or bool(driver.find_elements(By.ID, "LogName"))
+
+def grid_is_loaded(driver):
+    """main_report is present and jqGrid's loading overlay is hidden."""
+    if not driver.find_elements(By.ID, "main_report"):
+        return False
+    loaders = driver.find_elements(By.ID, "load_main_report")
+    return not loaders or not loaders[0].is_displayed()
+
+def first_grid_row_id(driver):
+    return driver.execute_script(
+        "var r = document.querySelector('#main_report tr[role=\"row\"][id]');"
+        "return r ? r.id : null;"
+    )
+
+def grid_reloaded(previous_row_id):
+    """Condition: grid finished loading and shows a different first row."""
+    def condition(driver):
+        return grid_is_loaded(driver) and first_grid_row_id(driver) not in (None, previous_row_id)
+    return condition
+
+
 def login(config, driver, base_url=BASE_URL, timeout=20):
     try:
         driver.get(base_url)
-        time.sleep(10)  # Extra wait for JS
+        # Wait for JS to render either the login form or the logged-in nav
+        try:
+            wait_for_signal(driver, login_form_or_welcome, "login page", replaced_sleep=10, timeout=timeout)
+        except TimeoutException:
+            print("[WARN] Neither login form nor welcome nav appeared")
         # driver.save_screenshot("login_page_headless.png")  # Check what page looks like
         # print(driver.current_url)  # Ensure no redirect
         # print(driver.page_source[:1000])  # Inspect
@@ -307,8 +926,8 @@ def login(config, driver, base_url=BASE_URL, timeout=20):
 
         print("[Info] Login successful")
 
-        # Wait until after login page loads (for example, wait for MAIN_TBL_NAV to appear)
-        wait.until(EC.presence_of_element_located((By.ID, "MAIN_TBL_NAV")))
+        # Wait until after login page loads and the nav greets the user
+        wait_for_signal(driver, nav_says_welcome, "login welcome", timeout=timeout)
 
         return True
     except Exception as e:
@@ -411,39 +1030,67 @@ def quick_search_handler(driver, start_date=None, end_date=None):
         driver.implicitly_wait(2)
         # Click the button with id "testBut"
         wait.until(EC.element_to_be_clickable((By.ID, "testBut"))).click()
-        time.sleep(10)
+        try:
+            wait_for_signal(driver, grid_is_loaded, "search results", replaced_sleep=10, timeout=30)
+        except TimeoutException:
+            # An empty result still renders main_report, so a missing grid means the search failed
+            print("[WARN] Search results grid did not load")
+            return False
         return True
     except Exception as e:
         print("Error occur in quick search handler ", e)
         return False
 
 def scrape_links_from_table(driver):
+    return [row["link"] for row in scrape_grid_rows(driver)]
+
+# One round-trip per grid page: link, visible text and every cell keyed by
+# its jqGrid column name (td aria-describedby="main_report_<col>")
+GRID_ROWS_JS = """
+var rows = document.querySelectorAll('#main_report tr[role="row"]');
+var out = [];
+for (var i = 0; i < rows.length; i++) {
+    var tds = rows[i].querySelectorAll('td');
+    var a = tds.length > 2 ? tds[2].querySelector('a') : null;
+    if (!a || !a.href) { continue; }
+    var cells = {};
+    for (var j = 0; j < tds.length; j++) {
+        var key = (tds[j].getAttribute('aria-describedby') || ('col' + j)).replace(/^main_report_/, '');
+        cells[key] = (tds[j].innerText || '').trim();
+    }
+    out.push({id: rows[i].id, link: a.href, summary: rows[i].innerText, cells: cells});
+}
+return out;
+"""
+
+def scrape_grid_rows(driver):
+    """
+    Page through the main_report grid.
+    Returns one {"link", "summary", "cells", "id"} dict per auction row, where
+    summary is the row's visible text (used to spot changed auctions) and
+    cells maps each grid column to its text (used by summary mode).
+    """
     wait = WebDriverWait(driver, 15)
     wait.until(lambda d: d.execute_script('return document.readyState') == 'complete')
 
     # Wait until the table is present
     links = []
+    pages = 0
     while True:
-        time.sleep(5)
         try:
-            table = wait.until(EC.presence_of_element_located((By.ID, "main_report")))
-
-            # Get all rows with role="row"
-            rows = table.find_elements(By.CSS_SELECTOR, 'tr[role="row"]')
+            wait_for_signal(driver, grid_is_loaded, "grid page", replaced_sleep=5, timeout=15)
+            rows = []
+            if getattr(driver, "capture_traffic", False):
+                rows = grid_rows_from_traffic(driver)
+            if not rows:
+                rows = driver.execute_script(GRID_ROWS_JS) or []
         except Exception as e:
             print("Table with auctions data not found ",e)
             return links
 
-        for row in rows:
-            try:
-                # Get the 3rd td and then its <a> tag
-                td = row.find_elements(By.TAG_NAME, "td")[2]  # index 2 = 3rd td
-                a_tag = td.find_element(By.TAG_NAME, "a")
-                href = a_tag.get_attribute("href")
-                links.append(href)
-            except Exception as e:
-                # Skip rows without the expected structure
-                continue
+        links.extend(rows)
+        pages += 1
+        report_progress("pagination", county=getattr(driver, "county", None), pages=pages, links=len(links))
         # Go to next page if available
         try:
             next_td = driver.find_element(By.ID, "next_pager")
@@ -453,10 +1100,11 @@ def scrape_links_from_table(driver):
                 print("[INFO] Next button disabled. Stopping pagination.")
                 break
             
-            # Click next
+            # Click next and wait for the grid to reload with new rows
+            previous_row_id = first_grid_row_id(driver)
             driver.execute_script("arguments[0].click();", next_td)
             print("[INFO] Clicked next page.")
-            time.sleep(3)  # wait for new data to load
+            wait_for_signal(driver, grid_reloaded(previous_row_id), "grid next page", replaced_sleep=3, timeout=15)
         except Exception as e:
             print("Error occur in next page btn ", e)
             break
@@ -464,59 +1112,243 @@ def scrape_links_from_table(driver):
     return links
 
 
-def extract_auction_and_case(driver, url, timeout=15):
+# ============================================================
+# Browserless fetch of detail pages
+# ============================================================
+def build_http_session(driver, config, pool_size=4):
+    """
+    Create a pooled requests.Session that reuses the logged-in driver's
+    cookies and user agent and goes through the same proxy.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=1)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.proxies.update(get_proxy_urls(config))
+
+    user_agent = driver.execute_script("return navigator.userAgent")
+    session.headers.update({
+        "User-Agent": user_agent,
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.9",
+        "Referer": config["base_url"],
+    })
+    copy_driver_cookies(driver, session)
+    return session
+
+def copy_driver_cookies(driver, session):
+    for cookie in driver.get_cookies():
+        session.cookies.set(
+            cookie["name"],
+            cookie["value"],
+            domain=cookie.get("domain"),
+            path=cookie.get("path", "/"),
+        )
+
+def fetch_auction_http(session, url, timeout=15):
+    """
+    Fetch and parse a detail page without the browser.
+    Returns None if the request is blocked, the markup isn't recognized or the
+    page carries neither status nor details (a shell that JS would fill in).
+    """
     try:
-        aid = get_aid_from_url(url)
-    except Exception as e:
-        print("Fail to get aid: ", e)
-        return {}
+        response = session.get(url, timeout=timeout)
+    except requests.RequestException as e:
+        print("HTTP fetch failed ", url, e)
+        return None
+
+    if response.status_code != 200:
+        print(f"HTTP fetch blocked ({response.status_code}) ", url)
+        return None
+
+    result = parse_auction_detail_html(response.text, url)
+    if not has_auction_data(result):
+        print("HTTP fetch: auction markup not found or empty, falling back to browser ", url)
+        return None
+    return result
+
+
+# ============================================================
+# Network capture (selenium-wire)
+# ============================================================
+AID_HREF_RE = re.compile(r"""href=["']([^"']*AID=\d+[^"']*)["']""", re.IGNORECASE)
+
+def captured_texts(driver):
+    """Yield (request, decoded body text) for every captured realforeclose response with a body."""
+    for request in driver.requests:
+        response = request.response
+        if response is None or not response.body:
+            continue
+        if not any(re.search(scope, request.url) for scope in CAPTURE_SCOPES):
+            continue
+        try:
+            body = decode_body(response.body, response.headers.get("Content-Encoding", "identity"))
+        except Exception:
+            continue
+        yield request, body.decode("utf-8", errors="replace")
+
+def json_or_none(text):
+    try:
+        return json.loads(text)
+    except (TypeError, ValueError):
+        return None
+
+def iter_json_strings(payload):
+    if isinstance(payload, str):
+        yield payload
+    elif isinstance(payload, dict):
+        for value in payload.values():
+            yield from iter_json_strings(value)
+    elif isinstance(payload, list):
+        for value in payload:
+            yield from iter_json_strings(value)
+
+def auction_from_traffic(driver, url):
+    """
+    Build the auction record from captured responses: the detail page document,
+    or HTML fragments for this AID inside AJAX JSON payloads.
+    Returns None until the captured data has the auction's status or details.
+    """
+    aid_str = str(get_aid_from_url(url))
+    strings = []
+    for request, text in captured_texts(driver):
+        payload = json_or_none(text)
+        if payload is None:
+            if f"AIC_MAIN_{aid_str}" in text:
+                result = parse_auction_detail_html(text, url)
+                if has_auction_data(result):
+                    return result
+            continue
+        strings.extend(iter_json_strings(payload))
+
+    html = auction_fragments_html(strings, aid_str)
+    if html is None:
+        return None
+    result = parse_auction_detail_html(html, url)
+    return result if has_auction_data(result) else None
+
+def extract_auction_from_traffic(driver, url, timeout=15, settle=1.5, poll=0.25):
+    """
+    Open the detail page and read the auction from selenium-wire's captured
+    traffic instead of the DOM. The capture buffer is cleared before and after
+    so it only ever holds one page's requests.
+    Once the page has finished loading, a matching response gets at most
+    `settle` more seconds; after that it returns None so the caller can read
+    the loaded DOM instead of waiting out the full timeout.
+    """
+    del driver.requests
+    driver.get(url)
+    try:
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            result = auction_from_traffic(driver, url)
+            if result is not None:
+                return result
+            if driver.execute_script("return document.readyState") == "complete":
+                deadline = min(deadline, time.time() + settle)
+            time.sleep(poll)
+        return None
+    finally:
+        del driver.requests
+
+def grid_columns(driver):
+    return driver.execute_script(
+        "try { return jQuery('#main_report').jqGrid('getGridParam', 'colModel')"
+        ".map(function (c) { return c.name; }); } catch (e) { return null; }"
+    ) or []
+
+def grid_rows_from_traffic(driver):
+    """
+    Read grid rows from the jqGrid JSON responses ({"rows": [{"id", "cell"}]})
+    captured since the last call, in the scrape_grid_rows() row shape.
+    """
+    column_names = None
+    rows = []
+    for request, text in captured_texts(driver):
+        payload = json_or_none(text)
+        if not isinstance(payload, dict) or not isinstance(payload.get("rows"), list):
+            continue
+        for item in payload["rows"]:
+            cells = item.get("cell", item) if isinstance(item, dict) else item
+            if isinstance(cells, dict):
+                names, values = list(cells.keys()), list(cells.values())
+            elif isinstance(cells, list):
+                if column_names is None:
+                    column_names = grid_columns(driver)
+                values = cells
+                names = column_names if len(column_names) == len(values) else [f"col{i}" for i in range(len(values))]
+            else:
+                continue
+
+            raw = " ".join(str(value) for value in values)
+            match = AID_HREF_RE.search(raw)
+            if not match:
+                continue
+            texts = [parse_html(str(value)).text() for value in values]
+            rows.append({
+                "id": str(item.get("id", "")) if isinstance(item, dict) else "",
+                "link": urljoin(driver.current_url, match.group(1).replace("&amp;", "&")),
+                "summary": " ".join(texts),
+                "cells": dict(zip(names, texts)),
+            })
+    del driver.requests
+    return rows
+
+
+def load_auction_page(driver, url, timeout=15):
+    """Open a detail page and wait for its AIC_MAIN container. Returns the container element."""
+    aid_str = str(get_aid_from_url(url))
 
     driver.get(url)
-    time.sleep(3)
-    result = {"auction_status": {}, "details": {}}
-    wait = WebDriverWait(driver, timeout)
-    wait.until(lambda d: d.execute_script('return document.readyState') == 'complete')
-    aid_str = str(aid)
 
     # Wait for container
     try:
-        container = wait.until(EC.presence_of_element_located((By.ID, f"AIC_MAIN_{aid_str}")))
+        return wait_for_signal(
+            driver,
+            EC.presence_of_element_located((By.ID, f"AIC_MAIN_{aid_str}")),
+            "auction detail",
+            replaced_sleep=3,
+            timeout=timeout,
+        )
     except TimeoutException:
         raise TimeoutException(f"AIC_MAIN_{aid_str} not found on page (timeout={timeout}s)")
 
+def extract_auction_and_case(driver, url, timeout=15):
+    """
+    Extract auction status and case details from a detail page.
+    Takes a single page_source snapshot and parses it locally instead of
+    querying every th/td/stats div through the driver.
+    """
+    try:
+        aid = get_aid_from_url(url)
+    except Exception as e:
+        print("Fail to get aid: ", e)
+        return {}
+
+    load_auction_page(driver, url, timeout)
+    result = parse_auction_detail_html(driver.page_source, url)
+    if result is None:
+        # Container was there a moment ago, read it element by element
+        return extract_auction_and_case_elements(driver, url, timeout, load=False)
+    return result
+
+def extract_auction_and_case_elements(driver, url, timeout=15, load=True):
+    """
+    Element-by-element extraction through the driver (one round-trip per cell).
+    Kept as a fallback and as the baseline for benchmark_detail_parsers().
+    """
+    aid_str = str(get_aid_from_url(url))
+    if load:
+        container = load_auction_page(driver, url, timeout)
+    else:
+        container = driver.find_element(By.ID, f"AIC_MAIN_{aid_str}")
+    result = {"auction_status": {}, "details": {}}
+
     # ---- Auction status parsing ----
     try:
         auction_item = container.find_element(By.CSS_SELECTOR, f"#AITEM_{aid_str}")
         stats_divs = auction_item.find_elements(By.CSS_SELECTOR, ".AUCTION_STATS > div")
-
-        auction_status = ""
-        date = ""
-        amount = ""
-
-        i = 0
-        while i < len(stats_divs):
-            label = stats_divs[i].text.strip()
-            value = stats_divs[i + 1].text.strip() if i + 1 < len(stats_divs) else ""
-
-            # First label will be status
-            if not auction_status and label:
-                auction_status = label
-                date = value  # may be empty for postponed/canceled
-                if not is_date(date):
-                    auction_status = date
-                    date = ""
-            elif label.lower() == "amount":
-                amount = value
-
-            i += 2
-
-        result["auction_status"] = {
-            "status": auction_status,
-            "date": date,
-            "amount": amount,
-            "link":url
-        }
-
+        result["auction_status"] = parse_auction_stats([div.text for div in stats_divs], url)
     except NoSuchElementException:
         result["auction_status"] = {"status": "", "date": "", "amount": ""}
 
@@ -531,42 +1363,692 @@ def extract_auction_and_case(driver, url, timeout=15):
             table = None
 
     if table:
-        rows = table.find_elements(By.TAG_NAME, "tr")
-        last_label = None
-        for row in rows:
+        detail_rows = []
+        for row in table.find_elements(By.TAG_NAME, "tr"):
             try:
                 ths = row.find_elements(By.TAG_NAME, "th")
                 tds = row.find_elements(By.TAG_NAME, "td")
                 if not ths or not tds:
                     continue
-
-                label_raw = ths[0].text.strip().replace(":", "")
-                if label_raw in ("", "\xa0"):
-                    if last_label:
-                        continuation = tds[0].text.strip()
-                        if continuation:
-                            prev = result["details"].get(last_label, "")
-                            merged = (prev + " " + continuation).strip()
-                            result["details"][last_label] = merged
-                    continue
-
-                value = tds[0].text.strip()
-                result["details"][label_raw] = value
-                last_label = label_raw
+                detail_rows.append((ths[0].text, tds[0].text))
             except Exception:
                 continue
+        result["details"] = merge_detail_rows(detail_rows)
 
     return result
 
 
 
+def benchmark_detail_parsers(driver, links, snapshot_dir=None):
+    """
+    Time the page_source parser against the element-by-element driver path on
+    the same (already loaded) pages and check both return the same data.
+    With `snapshot_dir` each page's HTML is saved there as <AID>.html.
+    """
+    html_total = 0.0
+    elements_total = 0.0
+    mismatches = 0
+    for link in links:
+        load_auction_page(driver, link)
+
+        start = time.perf_counter()
+        html = driver.page_source
+        from_html = parse_auction_detail_html(html, link)
+        html_total += time.perf_counter() - start
+
+        start = time.perf_counter()
+        from_elements = extract_auction_and_case_elements(driver, link, load=False)
+        elements_total += time.perf_counter() - start
+
+        if from_html != from_elements:
+            mismatches += 1
+            print("[Benchmark] Parsers disagree on ", link)
+
+        if snapshot_dir:
+            os.makedirs(snapshot_dir, exist_ok=True)
+            with open(os.path.join(snapshot_dir, f"{get_aid_from_url(link)}.html"), "w", encoding="utf-8") as f:
+                f.write(html)
+
+    count = len(links) or 1
+    report = {
+        "pages": len(links),
+        "html_avg_ms": round(html_total / count * 1000, 1),
+        "elements_avg_ms": round(elements_total / count * 1000, 1),
+        "mismatches": mismatches,
+    }
+    print("[Benchmark] ", report)
+    return report
+
+
+def relogin_if_logged_out(config, driver, label="Main", session=None):
+    """
+    Log the driver back in when a page timed out because the session dropped
+    mid-run (the nav no longer says Welcome). The HTTP session gets the new cookies.
+    Returns True if it logged in again.
+    """
+    try:
+        if nav_says_welcome(driver):
+            return False
+    except Exception as e:
+        print(f"[{label}] Could not read the nav after a timeout: {e}")
+        return False
+    print(f"[{label}] Session dropped mid-run, logging in again")
+    if not login(config, driver, config["base_url"]):
+        return False
+    wait_until_notice_gone(driver)
+    if session is not None:
+        copy_driver_cookies(driver, session)
+    return True
+
+def extract_with_retry(driver, link, retries=2, label="Main", session=None, config=None):
+    """
+    Extract one auction, retrying on failure.
+    With an HTTP `session` the page is fetched browserless first, then (with
+    SCRAPER_NETWORK_CAPTURE) read from captured traffic, and the DOM is only
+    scraped when both fail.
+    With `config`, a page timeout on a logged-out driver logs in again before the retry.
+    Returns the extracted dict, or None if every attempt failed.
+    """
+    if session is not None:
+        result = fetch_auction_http(session, link)
+        if result is not None:
+            return result
+
+    if getattr(driver, "capture_traffic", False):
+        try:
+            result = extract_auction_from_traffic(driver, link)
+            if result is None:
+                # No matching response, but the page is loaded: parse it without reloading
+                result = parse_auction_detail_html(driver.page_source, link)
+            if result is not None:
+                return result
+        except Exception as e:
+            print(f"[{label}] Traffic extraction failed for {link}: {e}")
+
+    for attempt in range(1, retries + 2):
+        try:
+            return extract_auction_and_case(driver, link)
+        except TimeoutException as e:
+            print(f"[{label}] Attempt {attempt} timed out for {link}: {e}")
+            if config is not None:
+                relogin_if_logged_out(config, driver, label, session)
+        except Exception as e:
+            print(f"[{label}] Attempt {attempt} failed for {link}: {e}")
+    return None
+
+
+def open_worker_driver(config, worker_id):
+    """Start and log in a detail worker's driver. Returns None if login failed."""
+    profile_dir = os.path.join(os.getcwd(), f"chrome-profile-{config['county']}-worker-{worker_id}")
+    driver = setup_driver(config, profile_dir=profile_dir)
+    if not login(config, driver, config["base_url"]):
+        driver.quit()
+        return None
+    wait_until_notice_gone(driver)
+    return driver
+
+def detail_worker(worker_id, config, jobs, emit, retries):
+    """
+    Worker thread: opens its own logged-in driver and drains (index, link) jobs
+    from the shared queue, handing each result to `emit(index, data)`.
+    Like BrowserService, the driver is recycled after SCRAPER_BROWSER_MAX_PAGES pages.
+    """
+    label = f"Worker {worker_id}"
+    max_pages = int(os.getenv("SCRAPER_BROWSER_MAX_PAGES") or 500)
+    driver = None
+    try:
+        driver = open_worker_driver(config, worker_id)
+        if driver is None:
+            print(f"[{label}] Login failed, leaving jobs for other workers")
+            return
+        session = build_http_session(driver, config) if config["http_fetch"] else None
+        pages = 0
+
+        while True:
+            try:
+                index, link = jobs.get_nowait()
+            except queue.Empty:
+                return
+            if pages >= max_pages:
+                print(f"[{label}] Recycling Chrome after {pages} pages")
+                driver.quit()
+                driver = None
+                driver = open_worker_driver(config, worker_id)
+                if driver is None:
+                    jobs.put((index, link))
+                    print(f"[{label}] Login failed after recycling, leaving jobs for other workers")
+                    return
+                session = build_http_session(driver, config) if config["http_fetch"] else None
+                pages = 0
+            emit(index, extract_with_retry(driver, link, retries, label, session, config))
+            pages += 1
+            print(f"[{label}] Get auction {index + 1}")
+    except Exception as e:
+        print(f"[{label}] Worker stopped: ", e)
+    finally:
+        if driver:
+            driver.quit()
+
+
+def scrape_details_with_workers(config, links, workers=None, retries=None, on_result=None):
+    """
+    Extract auction details with a pool of independently logged-in drivers.
+
+    Parameters:
+        config (dict): Env config from load_env().
+        links (list): Auction detail links from scrape_links_from_table().
+        workers (int): Number of browser workers (default: SCRAPER_WORKERS).
+        retries (int): Retries per auction (default: SCRAPER_DETAIL_RETRIES).
+        on_result (callable): If given, each extracted auction is passed to it
+            as soon as it's ready (e.g. AuctionWriter.put) instead of being kept.
+
+    Returns:
+        list: Extracted auctions in the same order as `links`. Auctions that
+        failed on every attempt are left out. Empty when `on_result` is used.
+    """
+    workers = workers or config["scraper_workers"]
+    retries = config["detail_retries"] if retries is None else retries
+    workers = max(1, limit_sessions(config, min(workers, len(links))))
+
+    jobs = queue.Queue()
+    for index, link in enumerate(links):
+        jobs.put((index, link))
+    results = [None] * len(links)
+
+    def emit(index, data):
+        if on_result is None:
+            results[index] = data
+        elif data is not None:
+            on_result(data)
+
+    threads = [
+        threading.Thread(target=detail_worker, args=(i + 1, config, jobs, emit, retries), daemon=True)
+        for i in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if not jobs.empty():
+        print(f"[WARN] {jobs.qsize()} links left unprocessed, all workers stopped")
+
+    auctions_info = [result for result in results if result is not None]
+    if on_result is None:
+        print(f"Extracted {len(auctions_info)} / {len(links)} auctions with {workers} workers")
+    return auctions_info
+
+
+# ============================================================
+# Date-range sharding of Quick Search
+# ============================================================
+def parse_date_value(value):
+    """date object from a date/datetime or a YYYY-MM-DD / MM/DD/YYYY string."""
+    if hasattr(value, "date") and callable(value.date):
+        return value.date()
+    if hasattr(value, "strftime"):
+        return value
+    for date_format in ("%Y-%m-%d", "%m/%d/%Y"):
+        try:
+            return datetime.strptime(value, date_format).date()
+        except (TypeError, ValueError):
+            continue
+    return None
+
+def split_date_range(from_date, to_date_value, shard_days):
+    """
+    Split the from/to window into consecutive shards of `shard_days` days,
+    as (start, end) YYYY-MM-DD strings. Open-ended windows aren't split.
+    """
+    start = parse_date_value(from_date) if from_date else None
+    end = parse_date_value(to_date_value) if to_date_value else None
+    if not start or not end or end < start or shard_days < 1:
+        return [(from_date, to_date_value)]
+
+    shards = []
+    while start <= end:
+        shard_end = min(start + timedelta(days=shard_days - 1), end)
+        shards.append((start.strftime("%Y-%m-%d"), shard_end.strftime("%Y-%m-%d")))
+        start = shard_end + timedelta(days=1)
+    return shards
+
+def harvest_shard(config, shard_no, start, end):
+    """Run Quick Search + grid pagination for one shard in its own browser session."""
+    driver = None
+    try:
+        profile_dir = os.path.join(os.getcwd(), f"chrome-profile-{config['county']}-shard-{shard_no}")
+        driver = setup_driver(config, profile_dir=profile_dir)
+        if not login(config, driver, config["base_url"]):
+            raise RuntimeError(f"[Shard {shard_no}] Login failed")
+        wait_until_notice_gone(driver)
+        # An empty grid after a failed search is not "no auctions", don't let it through
+        if not quick_search_handler(driver, start, end):
+            raise RuntimeError(f"[Shard {shard_no}] Quick Search failed for {start} -> {end}")
+        rows = scrape_grid_rows(driver)
+        print(f"[Shard {shard_no}] {start} -> {end}: {len(rows)} auctions")
+        return rows
+    finally:
+        if driver:
+            driver.quit()
+
+def harvest_grid_rows(config, driver, from_date, to_date_value):
+    """
+    Collect the grid rows for the from/to window. With SCRAPER_SHARD_WORKERS > 1
+    the window is split into SCRAPER_SHARD_DAYS-day shards that are searched in
+    parallel sessions, then de-duplicated by link. Otherwise the given driver
+    runs one search over the whole window.
+    """
+    shards = split_date_range(from_date, to_date_value, config["shard_days"])
+    if config["shard_workers"] <= 1 or len(shards) <= 1:
+        if not quick_search_handler(driver, from_date, to_date_value):
+            raise RuntimeError(f"Quick Search failed for {from_date} -> {to_date_value}")
+        return scrape_grid_rows(driver)
+
+    workers = limit_sessions(config, min(config["shard_workers"], len(shards)))
+    print(f"[Shards] Searching {len(shards)} shards with {workers} sessions")
+    # The search driver sits idle while the shard sessions run
+    with proxy_slots_released(driver), ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(harvest_shard, config, shard_no, start, end)
+            for shard_no, (start, end) in enumerate(shards, start=1)
+        ]
+        shard_rows = []
+        for future in futures:
+            try:
+                shard_rows.append(future.result())
+            except Exception as e:
+                # A missing shard would silently drop auctions, fail the run so it's retried
+                raise RuntimeError(f"Shard search failed: {e}") from e
+
+    grid_rows = []
+    seen = set()
+    for rows in shard_rows:
+        for row in rows:
+            if row["link"] not in seen:
+                seen.add(row["link"])
+                grid_rows.append(row)
+    return grid_rows
+
+
+# ============================================================
+# Streaming writer
+# ============================================================
+class AuctionWriter:
+    """
+    Writer stage of the scrape pipeline. Extractors put() records as they
+    finish, a background thread saves them in small batches, so memory stays
+    flat and a crash only loses the records of the current batch.
+    The Excel export is rewritten every `excel_every` batches and on close(),
+    since each export rewrites the whole workbook.
+
+    Links of every saved record are added to `written_links`, which a retry
+    can pass back in to skip them. `on_flush(batch)` runs on the writer
+    thread after each saved batch.
+    """
+
+    def __init__(self, connection, batch_size=None, written_links=None, on_flush=None, county=None, excel_every=None):
+        self.connection = connection
+        self.excel_every = excel_every or int(os.getenv("SCRAPER_EXCEL_EVERY") or 20)
+        self.excel_pending = []
+        # Workbook rows of this run's last export, dropped in close()
+        self.excel_cache = {}
+        self.county = county
+        self.batches = 0
+        self.on_flush = on_flush
+        self.batch_size = batch_size or int(os.getenv("SCRAPER_STREAM_BATCH_SIZE") or 25)
+        self.written_links = written_links if written_links is not None else set()
+        self.counts = {"inserted": 0, "updated": 0, "unchanged": 0, "failed": 0}
+        self.written = 0
+        self.error = None
+        # Bounded so fast extractors wait for the writer instead of piling up records
+        self.queue = queue.Queue(maxsize=self.batch_size * 4)
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def put(self, record):
+        if self.error:
+            raise self.error
+        self.queue.put(record)
+
+    def close(self):
+        """Flush what's left and stop the writer. Re-raises a write error."""
+        self.queue.put(None)
+        self.thread.join()
+        self.excel_cache.clear()
+        print(f"[Writer] Saved {self.written} records: {self.counts}")
+        if self.error:
+            raise self.error
+        return self.written
+
+    def _run(self):
+        batch = []
+        while True:
+            record = self.queue.get()
+            if record is None:
+                break
+            if self.error:
+                continue  # keep draining so producers don't block
+            batch.append(record)
+            if len(batch) >= self.batch_size:
+                self._flush(batch)
+                batch = []
+        if batch and not self.error:
+            self._flush(batch)
+        self._export_excel()
+
+    def _export_excel(self):
+        if not self.excel_pending:
+            return
+        try:
+            save_auctions_to_excel(self.excel_pending, cache=self.excel_cache)
+        except Exception as e:
+            # The DB is the source of truth; a failed export is retried with the next one
+            print("[Writer] Excel export failed ", e)
+            return
+        self.excel_pending = []
+
+    def _flush(self, batch):
+        try:
+            counts = save_auctions_to_db(batch, self.connection)
+        except Exception as e:
+            print("[Writer] Failed to save batch ", e)
+            self.error = e
+            return
+
+        for key in self.counts:
+            self.counts[key] += counts[key]
+        self.batches += 1
+        self.excel_pending.extend(batch)
+        if self.batches % self.excel_every == 0:
+            self._export_excel()
+        report_progress("saving", county=self.county, batches=self.batches, batch_size=len(batch),
+                        changed=counts["inserted"] + counts["updated"], **self.counts)
+        if counts["failed"]:
+            return  # leave the batch's links for the retry
+        self.written += len(batch)
+        for record in batch:
+            self.written_links.add(record.get("auction_status", {}).get("link"))
+        if self.on_flush:
+            try:
+                self.on_flush(batch)
+            except Exception as e:
+                print("[Writer] on_flush callback failed ", e)
+
+
+
+# ============================================================
+# Resumable checkpoints
+# ============================================================
+def ensure_checkpoint_table(connection):
+    if "scraper_checkpoints" in ready_tables:
+        return
+    with connection.cursor() as cursor:
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS scraper_checkpoints (
+                run_key VARCHAR(64) NOT NULL,
+                date_from DATE DEFAULT NULL,
+                date_to DATE DEFAULT NULL,
+                status VARCHAR(20) NOT NULL,
+                total_links INT NOT NULL DEFAULT 0,
+                done_links INT NOT NULL DEFAULT 0,
+                grid_rows LONGTEXT,
+                done_aids LONGTEXT,
+                started_at DATETIME DEFAULT NULL,
+                updated_at DATETIME DEFAULT NULL,
+                PRIMARY KEY (run_key)
+            ) CHARACTER SET utf8mb4
+        """)
+    connection.commit()
+    ready_tables.add("scraper_checkpoints")
+
+def get_checkpoint_key(from_date, to_date, county="broward"):
+    return f"{county}_{from_date or 'all'}_{to_date or 'all'}"
+
+def load_checkpoint(connection, from_date, to_date, county="broward"):
+    """
+    Return the AIDs an unfinished run of this from/to window already saved,
+    or None if there is nothing to resume.
+    Only the saved AIDs are resumed: the caller searches again so auctions
+    published since the checkpoint are picked up.
+    Checkpoints older than SCRAPER_CHECKPOINT_MAX_AGE_HOURS (default 24) are ignored.
+    """
+    if not connection.open:
+        connection.ping(reconnect=True)
+    ensure_checkpoint_table(connection)
+    max_age = int(os.getenv("SCRAPER_CHECKPOINT_MAX_AGE_HOURS") or 24)
+
+    with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        cursor.execute(
+            """
+            SELECT done_aids FROM scraper_checkpoints
+            WHERE run_key = %s AND status <> 'done'
+              AND updated_at >= NOW() - INTERVAL %s HOUR
+            """,
+            (get_checkpoint_key(from_date, to_date, county), max_age),
+        )
+        row = cursor.fetchone()
+    if not row:
+        return None
+    return set(json.loads(row["done_aids"] or "[]"))
+
+def save_checkpoint(connection, from_date, to_date, grid_rows, county="broward", done_aids=()):
+    """Start a checkpoint for this window with the harvested grid rows and the AIDs already saved."""
+    done_aids = sorted(done_aids)
+    if not connection.open:
+        connection.ping(reconnect=True)
+    ensure_checkpoint_table(connection)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            REPLACE INTO scraper_checkpoints (
+                run_key, date_from, date_to, status, total_links, done_links,
+                grid_rows, done_aids, started_at, updated_at
+            ) VALUES (%s, %s, %s, 'running', %s, %s, %s, %s, NOW(), NOW())
+            """,
+            (
+                get_checkpoint_key(from_date, to_date, county), from_date, to_date, len(grid_rows),
+                len(done_aids), json.dumps(grid_rows), json.dumps(done_aids),
+            ),
+        )
+    connection.commit()
+
+def update_checkpoint(connection, from_date, to_date, done_links, status="running", county="broward"):
+    """Record which auctions of the window are saved."""
+    if not connection.open:
+        connection.ping(reconnect=True)
+    done_aids = sorted(aid for aid in (get_aid_from_url(link) for link in done_links if link) if aid)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            UPDATE scraper_checkpoints
+            SET done_aids = %s, done_links = %s, status = %s, updated_at = NOW()
+            WHERE run_key = %s
+            """,
+            (json.dumps(done_aids), len(done_aids), status, get_checkpoint_key(from_date, to_date, county)),
+        )
+    connection.commit()
+
+
+# ============================================================
+# Incremental runs
+# ============================================================
+def load_known_auctions(connection, county, table_name="auctions"):
+    """
+    Return {Link: {"status": ..., "grid_hash": ...}} for the county's stored auctions.
+    Keyed by Link, not AID: AIDs are only unique within one county's site.
+    """
+    if not connection.open:
+        connection.ping(reconnect=True)
+    ensure_auctions_table(connection, table_name)
+
+    known = {}
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT Link, AuctionStatus, GridHash FROM `{table_name}` WHERE County = %s AND Link IS NOT NULL",
+            (county,),
+        )
+        for link, status, grid_hash in cursor.fetchall():
+            known[link] = {"status": status or "", "grid_hash": grid_hash or ""}
+    return known
+
+# ============================================================
+# Warm browser service
+# ============================================================
+class BrowserService:
+    """
+    Long-lived logged-in Chrome reused across scraper runs, so scheduled and
+    manual runs skip Chrome startup, proxy handshake and login.
+
+    acquire() hands out the driver (one run at a time) after making sure it's
+    alive and still logged in. Every page the driver loads is counted, and
+    Chrome is recycled after SCRAPER_BROWSER_MAX_PAGES of them to cap its
+    memory growth: on the next acquire(), or mid-run through page_loaded().
+    """
+
+    def __init__(self, config=None, max_pages=None):
+        self.config = config or load_env()
+        self.county = self.config["county"]
+        self.max_pages = max_pages or int(os.getenv("SCRAPER_BROWSER_MAX_PAGES") or 500)
+        self.driver = None
+        self.pages = 0
+        self.started_at = None
+        self.lock = threading.Lock()
+
+    def start(self):
+        driver = setup_driver(self.config)
+        # Count every navigation, whichever code path (search, pagination, details) makes it
+        get_page = driver.get
+        def counted_get(url):
+            self.pages += 1
+            return get_page(url)
+        driver.get = counted_get
+        self.driver = driver
+        self.pages = 0
+        self.started_at = datetime.now()
+        if not login(self.config, self.driver, self.config["base_url"]):
+            self.stop()
+            raise RuntimeError(f"[Browser] Login failed for {self.county}")
+        wait_until_notice_gone(self.driver)
+        print("[Browser] Started warm browser")
+
+    def stop(self):
+        if self.driver:
+            try:
+                self.driver.quit()
+            except Exception as e:
+                print("[Browser] Error quitting driver ", e)
+        self.driver = None
+
+    def recycle(self):
+        print(f"[Browser] Recycling Chrome after {self.pages} pages")
+        self.stop()
+        self.start()
+
+    def is_alive(self):
+        try:
+            return self.driver is not None and self.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def ensure_ready(self):
+        """Restart a dead or worn-out browser and log back in if the session dropped."""
+        if not self.is_alive():
+            self.stop()
+            self.start()
+        elif self.pages >= self.max_pages:
+            self.recycle()
+        # The current DOM may be hours old, login() loads the home page fresh and
+        # returns straight away when the nav still says Welcome
+        elif login(self.config, self.driver, self.config["base_url"]):
+            wait_until_notice_gone(self.driver)
+        else:
+            print("[Browser] Login failed on the warm browser, restarting it")
+            self.stop()
+            self.start()
+        return self.driver
+
+    def acquire(self):
+        self.lock.acquire()
+        try:
+            return self.ensure_ready()
+        except Exception:
+            self.lock.release()
+            raise
+
+    def release(self):
+        self.lock.release()
+
+    def page_loaded(self):
+        """Returns the driver to keep using: a new one if this one reached max_pages."""
+        if self.pages >= self.max_pages:
+            self.recycle()
+        return self.driver
+
+    def health_check(self):
+        """
+        Status for the health endpoint. The driver isn't thread safe, so while a
+        run holds it the check reports busy instead of sending it commands.
+        """
+        busy = not self.lock.acquire(blocking=False)
+        alive = self.driver is not None
+        logged_in = None
+        if not busy:
+            try:
+                alive = self.is_alive()
+                logged_in = False
+                if alive:
+                    try:
+                        logged_in = nav_says_welcome(self.driver)
+                    except Exception:
+                        logged_in = False
+            finally:
+                self.lock.release()
+        return {
+            "alive": alive,
+            "busy": busy,
+            "logged_in": logged_in,
+            "pages": self.pages,
+            "max_pages": self.max_pages,
+            "started_at": str(self.started_at) if self.started_at else None,
+        }
+
+browser_services = {}
+browser_service_lock = threading.Lock()
+
+def get_browser_service(county=None):
+    """Process-wide BrowserService per county; Chrome itself only starts on first acquire()."""
+    config = load_env(county)
+    with browser_service_lock:
+        if config["county"] not in browser_services:
+            browser_services[config["county"]] = BrowserService(config)
+        return browser_services[config["county"]]
+
+
 # ============================================================
 # 8️⃣ Main entry point
 # ============================================================
-def main(turn=0):
-    
-    auctions_info = []
-    config = load_env()
+def main(turn=0, incremental=None, written_links=None, summary=None, service=None, county=None):
+    """
+    Run one scrape. Records stream into an AuctionWriter as they're extracted.
+    Links in `written_links` were saved by an earlier attempt and are skipped;
+    newly saved links are added to it.
+    In summary mode known auctions are updated from the grid rows alone and
+    only new auctions get a detail page.
+    With a BrowserService the warm, logged-in driver is used and left running.
+    """
+    skipped = 0
+    written = 0
+    writer = None
+    config = load_env(county)
+    county = config["county"]
+    reset_wait_report(county)
+    reset_resource_report(county)
+    if incremental is None:
+        incremental = config["incremental"]
+    if summary is None:
+        summary = config["summary_mode"]
+    if written_links is None:
+        written_links = set()
     conn = connect_db(config)
     print("Env loaded")
     data=get_from_and_to(conn)
@@ -575,35 +2057,127 @@ def main(turn=0):
     if turn>3:
         from_date=None
         to_date=None
-    driver = setup_driver(config)
+    if service:
+        driver = service.acquire()
+    else:
+        driver = setup_driver(config)
     try:
-        if driver:
-            login(config, driver, BASE_URL)
+        report_progress("login", county=county)
+        if driver and not service:
+            login(config, driver, config["base_url"])
             wait_until_notice_gone(driver)
-            quick_search_handler(driver, from_date, to_date)
-            links = scrape_links_from_table(driver)
-            i=0
-            for link in links:
-                data=extract_auction_and_case(driver, link)
-                auctions_info.append(data)
-                print("Get ", i+1, " auction")
-                i=i+1
-                
-        save_auctions_to_db(auctions_info, conn)
-        save_auctions_to_excel(auctions_info)
-        return len(auctions_info)
-    finally:
         if driver:
+
+            done_aids = load_checkpoint(conn, from_date, to_date, county) if config["checkpoints"] else None
+            report_progress("search", county=county, date_from=str(from_date or ""), date_to=str(to_date or ""))
+            grid_rows = harvest_grid_rows(config, driver, from_date, to_date)
+            if done_aids:
+                # Resume: search again for newly published auctions, skip the ones the checkpoint saved
+                written_links.update(row["link"] for row in grid_rows if get_aid_from_url(row["link"]) in done_aids)
+                print(f"[Resume] Checkpoint with {len(done_aids)} done, {len(grid_rows)} links in the grid now")
+            if config["checkpoints"]:
+                save_checkpoint(conn, from_date, to_date, grid_rows, county, done_aids=done_aids or ())
+            grid_hashes = {row["link"]: grid_summary_hash(row["summary"]) for row in grid_rows}
+            summaries = []
+            known = load_known_auctions(conn, county) if incremental or summary else {}
+            if incremental:
+                all_links = [row["link"] for row in grid_rows]
+                grid_rows, skipped = select_rows_to_fetch(grid_rows, known)
+                # Unchanged auctions are already in the DB, count them as done for the checkpoint
+                fetch_links = {row["link"] for row in grid_rows}
+                written_links.update(link for link in all_links if link not in fetch_links)
+            if summary:
+                grid_rows, summaries = split_summary_rows(grid_rows, known)
+            done = [row for row in grid_rows if row["link"] in written_links]
+            if done:
+                print(f"[Resume] {len(done)} auctions already saved by a previous attempt")
+                skipped += len(done)
+                grid_rows = [row for row in grid_rows if row["link"] not in written_links]
+            summaries = [record for record in summaries if record["auction_status"]["link"] not in written_links]
+            links = [row["link"] for row in grid_rows]
+
+            # conn belongs to the writer thread from here on
+            on_flush = None
+            if config["checkpoints"]:
+                on_flush = lambda batch: update_checkpoint(conn, from_date, to_date, written_links, county=county)
+            writer = AuctionWriter(conn, written_links=written_links, on_flush=on_flush, county=county)
+
+            total = len(summaries) + len(links)
+            extracted = {"count": 0, "started": time.time()}
+            extracted_lock = threading.Lock()
+            report_progress("extracting", county=county, extracted=0, total=total, per_second=0.0)
+
+            def emit(data):
+                data["county"] = county
+                data["grid_hash"] = grid_hashes.get(data.get("auction_status", {}).get("link"), "")
+                writer.put(data)
+                with extracted_lock:
+                    extracted["count"] += 1
+                    count = extracted["count"]
+                elapsed = time.time() - extracted["started"]
+                report_progress(
+                    "extracting", county=county, extracted=count, total=total,
+                    per_second=round(count / elapsed, 2) if elapsed > 0 else 0.0,
+                )
+
+            # Summary mode: known auctions are refreshed straight from their grid row
+            for record in summaries:
+                emit(record)
+
+            if config["scraper_workers"] > 1 and len(links) > 1:
+                # The search driver is idle from here on, free it (or, when warm, its proxy slots) for the workers
+                if not service:
+                    driver.quit()
+                    driver = None
+                with proxy_slots_released(driver):
+                    scrape_details_with_workers(config, links, on_result=emit)
+            else:
+                session = build_http_session(driver, config) if config["http_fetch"] else None
+                i=0
+                for link in links:
+                    data=extract_with_retry(driver, link, config["detail_retries"], session=session, config=config)
+                    if data is not None:
+                        emit(data)
+                    print("Get ", i+1, " auction")
+                    i=i+1
+                    if service:
+                        recycled = service.page_loaded()
+                        if recycled is not driver:
+                            driver = recycled
+                            session = build_http_session(driver, config) if config["http_fetch"] else None
+
+            report_progress("saving", county=county, final=True)
+            written = writer.close()
+            writer = None
+            if config["checkpoints"]:
+                update_checkpoint(conn, from_date, to_date, written_links, status="done", county=county)
+        report_progress("finished", county=county, written=written, skipped=skipped)
+        # Skipped auctions count as handled, so an all-unchanged run isn't retried as a failure
+        return written + skipped
+    finally:
+        if writer:
+            try:
+                writer.close()  # save whatever was extracted before the failure
+            except Exception as e:
+                print("Error flushing writer ", e)
+        if service:
+            service.release()
+        elif driver:
             driver.quit()
         if conn:
             conn.close()
+        wait_report(county)
+        resource_report(county)
         print("✅ Scraper finished.")
         
-def run_scraper():
+def run_scraper(service=None, county=None):
+    """Run main() with retries. Pass a BrowserService to reuse its warm browser."""
     try:
         no_of_rows=0
+        # Links saved so far, shared by all attempts so a retry only redoes unsaved auctions
+        written_links = set()
         try:
-            no_of_rows = main()
+            no_of_rows = main(written_links=written_links, service=service, county=county)
         except:
             print("Scraper Failed on initail try")
         if no_of_rows > 0:
@@ -611,7 +2185,7 @@ def run_scraper():
 
         for i in range(5):
             try:
-                no_of_rows = main(i)
+                no_of_rows = main(i, written_links=written_links, service=service, county=county)
                 print("Sucessuflly Completed!")
             except:
                 print(f"Scraper failed in {i+1} try")
@@ -624,6 +2198,37 @@ def run_scraper():
         print("Error in main ", e)
         return 0
 
+def run_all_counties(counties=None, use_warm_browser=False):
+    """
+    Scrape several counties at the same time, SCRAPER_COUNTY_CONCURRENCY at once
+    (default: all). Counties come from SCRAPER_COUNTIES (comma separated,
+    default: SCRAPER_COUNTY or broward). Per-county browser counts and proxy
+    budgets come from the _<COUNTY> env overrides.
+
+    Returns:
+        int: Auctions handled over all counties.
+    """
+    load_dotenv()
+    if counties is None:
+        counties = [c.strip().lower() for c in (os.getenv("SCRAPER_COUNTIES") or os.getenv("SCRAPER_COUNTY") or "broward").split(",") if c.strip()]
+    unknown = [county for county in counties if county not in get_counties()]
+    if unknown:
+        print("Unknown counties skipped: ", unknown)
+    counties = [county for county in counties if county not in unknown]
+    if not counties:
+        return 0
+
+    def run_county(county):
+        service = get_browser_service(county) if use_warm_browser else None
+        return run_scraper(service=service, county=county)
+
+    concurrency = max(1, int(os.getenv("SCRAPER_COUNTY_CONCURRENCY") or len(counties)))
+    reserve_db_connections(min(concurrency, len(counties)))
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = dict(zip(counties, executor.map(run_county, counties)))
+    print("[Counties] Auctions per county: ", results)
+    return sum(results.values())
+
 if __name__ == "__main__":
     try:
         main()
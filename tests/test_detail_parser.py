@@ -0,0 +1,119 @@
+"""
+Detail page parsing against the pages in tests/fixtures.
+
+The fixture pages are hand-made in the markup the parser expects, with the
+row labels auction_to_row() reads, so a parse -> row round trip is covered.
+"""
+from datetime import datetime
+from decimal import Decimal
+
+import auction_parser
+from conftest import read_fixture
+
+SOLD_URL = "https://broward.realforeclose.com/index.cfm?zaction=AUCTION&zmethod=DETAILS&AID=318522"
+CANCELED_URL = "https://broward.realforeclose.com/index.cfm?zaction=AUCTION&zmethod=DETAILS&AID=318977"
+
+
+def test_sold_auction_fields():
+    result = auction_parser.parse_auction_detail_html(read_fixture("auction_sold.html"), SOLD_URL)
+
+    assert result["auction_status"] == {
+        "status": "Auction Sold",
+        "date": "10/16/2025 10:00 AM ET",
+        "amount": "$125,100.00",
+        "link": SOLD_URL,
+    }
+    details = result["details"]
+    assert details["Case Type"] == "FORECLOSURE"
+    assert details["Case Number"] == "CACE-22-004431"
+    assert details["Final Judgment Amount"] == "$231,874.52"
+    assert details["Parcel ID"] == "4842 35 07 0210"
+    assert details["Assessed Value"] == "$198,410.00"
+    assert details["Plaintiff Max Bid"] == "Hidden"
+
+
+def test_address_continuation_row_is_merged():
+    result = auction_parser.parse_auction_detail_html(read_fixture("auction_sold.html"), SOLD_URL)
+
+    assert result["details"]["Property Address"] == "1234 NW 5TH AVE FORT LAUDERDALE, FL- 33311"
+
+
+def test_sold_page_fills_auctions_row():
+    result = auction_parser.parse_auction_detail_html(read_fixture("auction_sold.html"), SOLD_URL)
+    row = auction_parser.auction_to_row({**result, "county": "broward"})
+
+    assert row["CaseNo"] == "CACE-22-004431"
+    assert row["CaseNoKey"] == "CACE22004431"
+    assert row["AuctionType"] == "FORECLOSURE"
+    assert row["ParcelID"] == "4842 35 07 0210"
+    assert row["ParcelKey"] == "484235070210"
+    assert row["PropertyAddress"] == "1234 NW 5TH AVE FORT LAUDERDALE, FL- 33311"
+    assert row["FinalJudgementAmount"] == Decimal("231874.52")
+    assert row["AuctionStatus"] == "Auction Sold"
+    assert row["AuctionDateTime"] == datetime(2025, 10, 16, 10, 0)
+    assert row["AuctionSoldAmount"] == Decimal("125100.00")
+    assert row["AID"] == 318522
+    assert row["Link"] == SOLD_URL
+    assert row["County"] == "broward"
+
+
+def test_canceled_auction_without_date():
+    result = auction_parser.parse_auction_detail_html(read_fixture("auction_canceled.html"), CANCELED_URL)
+
+    assert result["auction_status"]["status"] == "Canceled per County"
+    assert result["auction_status"]["date"] == ""
+    assert result["auction_status"]["amount"] == ""
+    # Rows with unclosed <tr>/<td> still come out one label per row
+    assert result["details"] == {
+        "Case Type": "TAXDEED",
+        "Case Number": "2023-1187",
+        "Parcel ID": "5042 01 AB 0070",
+        "Property Address": "UNKNOWN",
+    }
+
+    row = auction_parser.auction_to_row(result)
+    assert row["AuctionStatus"] == "Canceled per County"
+    assert row["AuctionDateTime"] is None
+    assert row["AuctionSoldAmount"] is None
+    assert row["AuctionType"] == "TAXDEED"
+
+
+def test_unrecognized_markup_returns_none():
+    assert auction_parser.parse_auction_detail_html(read_fixture("login_required.html"), SOLD_URL) is None
+    # Page for a different auction than the one requested
+    assert auction_parser.parse_auction_detail_html(read_fixture("auction_sold.html"), CANCELED_URL) is None
+    assert auction_parser.parse_auction_detail_html(read_fixture("auction_sold.html"), "https://example.com/no-aid") is None
+
+
+def test_html_text_matches_webelement_rendering():
+    root = auction_parser.parse_html("<div>  Sold <b>To</b><br>3rd&nbsp;Party <script>x()</script></div>")
+
+    assert root.find_all("div")[0].text() == "Sold To\n3rd Party"
+
+
+def test_skeleton_page_has_no_auction_data():
+    url = "https://broward.realforeclose.com/index.cfm?zaction=AUCTION&zmethod=DETAILS&AID=400204"
+    result = auction_parser.parse_auction_detail_html(read_fixture("auction_skeleton.html"), url)
+
+    assert result is not None
+    assert not auction_parser.has_auction_data(result)
+    assert auction_parser.has_auction_data(
+        auction_parser.parse_auction_detail_html(read_fixture("auction_sold.html"), SOLD_URL)
+    )
+
+
+def test_ajax_fragments_of_other_auctions_are_ignored():
+    # A payload listing AITEM_9 before AITEM_5 must not lend AID 5 the other case's details
+    url = "https://broward.realforeclose.com/index.cfm?zaction=AUCTION&zmethod=DETAILS&AID=5"
+    strings = [
+        '<div id="AITEM_9"><table class="bdTab"><tr><th>Case Number:</th><td>OTHER-9</td></tr></table></div>',
+        '<div id="AITEM_50"><table class="bdTab"><tr><th>Case Number:</th><td>OTHER-50</td></tr></table></div>',
+        '<div id="AITEM_5"><div class="AUCTION_STATS"><div>Auction Sold</div><div>10/16/2025 10:00 AM ET</div>'
+        '<div>$1,000.00</div></div><table class="bdTab"><tr><th>Case Number:</th><td>OWN-5</td></tr></table></div>',
+        "plain text, no markup",
+    ]
+
+    result = auction_parser.parse_auction_detail_html(auction_parser.auction_fragments_html(strings, 5), url)
+
+    assert result["details"] == {"Case Number": "OWN-5"}
+    assert auction_parser.auction_fragments_html(strings[:2], 5) is None
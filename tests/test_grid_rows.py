@@ -0,0 +1,67 @@
+"""Incremental and summary-mode decisions over grid rows."""
+from auction_parser import auction_to_row, grid_summary_hash, select_rows_to_fetch, split_summary_rows
+
+LINK = "https://broward.realforeclose.com/index.cfm?zaction=AUCTION&zmethod=DETAILS&AID={}"
+
+
+def grid_row(aid, summary="10/16/2025 CACE-22-004431 1234 NW 5TH AVE", **cells):
+    return {"id": str(aid), "link": LINK.format(aid), "summary": summary, "cells": cells}
+
+
+def test_pending_auction_that_has_sold_gets_a_detail_page():
+    # Stored as pending; the grid can't say it sold since, only the detail page can
+    known = {LINK.format(318522): {"status": "Auction Starts", "grid_hash": ""}}
+    rows = [grid_row(318522, auctiondate="10/16/2025 10:00 AM ET")]
+
+    detail_rows, summaries = split_summary_rows(rows, known)
+
+    assert [row["link"] for row in detail_rows] == [LINK.format(318522)]
+    assert summaries == []
+
+
+def test_finalized_auction_is_refreshed_from_its_grid_row():
+    known = {LINK.format(318522): {"status": "Auction Sold", "grid_hash": ""}}
+    rows = [grid_row(318522, auctiondate="10/16/2025 10:00 AM ET", casenumber="CACE-22-004431", status="Canceled")]
+
+    detail_rows, summaries = split_summary_rows(rows, known)
+
+    assert detail_rows == []
+    row = auction_to_row(summaries[0])
+    assert row["CaseNo"] == "CACE-22-004431"
+    # The grid's status column never overwrites the stored status (blank keeps it)
+    assert row["AuctionStatus"] == ""
+    assert row["AuctionSoldAmount"] is None
+
+
+def test_new_auction_gets_a_detail_page():
+    detail_rows, summaries = split_summary_rows([grid_row(400001)], {})
+
+    assert len(detail_rows) == 1 and summaries == []
+
+
+def test_incremental_skips_only_finalized_unchanged_rows():
+    unchanged = grid_row(1, summary="sold row")
+    changed = grid_row(2, summary="sold row, new date")
+    pending = grid_row(3, summary="pending row")
+    known = {
+        LINK.format(1): {"status": "Auction Sold", "grid_hash": grid_summary_hash("sold row")},
+        LINK.format(2): {"status": "Auction Sold", "grid_hash": grid_summary_hash("sold row")},
+        LINK.format(3): {"status": "Auction Starts", "grid_hash": grid_summary_hash("pending row")},
+    }
+
+    to_fetch, skipped = select_rows_to_fetch([unchanged, changed, pending], known)
+
+    assert skipped == 1
+    assert [row["id"] for row in to_fetch] == ["2", "3"]
+
+
+def test_same_aid_in_another_county_is_not_known():
+    # AIDs repeat across counties, the stored Link tells them apart
+    other_county = LINK.format(318522).replace("broward", "palmbeach")
+    known = {other_county: {"status": "Auction Sold", "grid_hash": grid_summary_hash("sold row")}}
+
+    to_fetch, skipped = select_rows_to_fetch([grid_row(318522, summary="sold row")], known)
+    detail_rows, summaries = split_summary_rows([grid_row(318522)], known)
+
+    assert skipped == 0 and len(to_fetch) == 1
+    assert len(detail_rows) == 1 and summaries == []
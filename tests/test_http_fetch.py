@@ -0,0 +1,72 @@
+"""
+Browserless detail fetch (fetch_auction_http) against a local server
+serving the pages in tests/fixtures.
+
+fetch_auction_http lives in index.py, which imports the browser stack at
+module level, so these tests are skipped where it isn't installed.
+"""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from conftest import read_fixture
+
+index = pytest.importorskip("index")
+requests = pytest.importorskip("requests")
+
+PAGES = {
+    "318522": (200, "auction_sold.html"),
+    "318977": (200, "auction_canceled.html"),
+    "400001": (200, "login_required.html"),
+    "400204": (200, "auction_skeleton.html"),
+    "400403": (403, "login_required.html"),
+}
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        aid = index.get_aid_from_url(self.path)
+        status, name = PAGES.get(aid, (404, "login_required.html"))
+        body = read_fixture(name).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fixture_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/index.cfm?zaction=AUCTION&zmethod=DETAILS"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_fetch_auction_http_parses_page(fixture_server):
+    with requests.Session() as session:
+        result = index.fetch_auction_http(session, f"{fixture_server}&AID=318522", timeout=5)
+
+    assert result["auction_status"]["status"] == "Auction Sold"
+    assert result["details"]["Case Number"] == "CACE-22-004431"
+
+
+def test_fetch_auction_http_falls_back_on_block_or_login(fixture_server):
+    with requests.Session() as session:
+        assert index.fetch_auction_http(session, f"{fixture_server}&AID=400403", timeout=5) is None
+        assert index.fetch_auction_http(session, f"{fixture_server}&AID=400001", timeout=5) is None
+
+
+def test_fetch_auction_http_falls_back_on_empty_skeleton(fixture_server):
+    # Container present, stats and details only filled in by JS
+    with requests.Session() as session:
+        assert index.fetch_auction_http(session, f"{fixture_server}&AID=400204", timeout=5) is None